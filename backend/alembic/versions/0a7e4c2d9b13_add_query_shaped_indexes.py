@@ -0,0 +1,52 @@
+"""add_query_shaped_indexes
+
+Revision ID: 0a7e4c2d9b13
+Revises: f2c7d9a4b816
+Create Date: 2026-10-18 18:20:11.847305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0a7e4c2d9b13"
+down_revision: Union[str, Sequence[str], None] = "f2c7d9a4b816"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns), each matching a query the routers run on every page
+# load; `python -m bench.indexes` checks they are used (see its docstring)
+INDEXES = [
+    # GET /applications?status=... with the default -last_update_at sort
+    (
+        "ix_applications_user_status_last_update_at_id",
+        "applications",
+        ["user_id", "status", "last_update_at", "id"],
+    ),
+    # child lists: WHERE application_id = ? ORDER BY created_at / due_at
+    ("ix_notes_application_created", "notes", ["application_id", "created_at"]),
+    ("ix_stages_application_created", "stages", ["application_id", "created_at"]),
+    ("ix_reminders_application_due", "reminders", ["application_id", "due_at"]),
+    ("ix_contacts_application_id", "contacts", ["application_id"]),
+    ("ix_documents_application_id", "documents", ["application_id"]),
+    # applications carrying a tag (the primary key leads with application_id)
+    ("ix_application_tags_tag_application", "application_tags", ["tag_id", "application_id"]),
+    # case-insensitive tag name lookups
+    ("ix_tags_lower_name", "tags", [sa.text("lower(name)")]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,48 @@
+"""add_application_search
+
+Revision ID: 1b6e3f0a9c21
+Revises: 7239937fef8b
+Create Date: 2026-10-18 09:12:04.118302
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "1b6e3f0a9c21"
+down_revision: Union[str, Sequence[str], None] = "7239937fef8b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # generated tsvector kept in sync by Postgres itself; weights rank
+    # company/role hits above location and the pasted job description
+    op.execute(
+        """
+        ALTER TABLE applications ADD COLUMN search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('english', coalesce(company, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(role, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(location, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(jd_text, '')), 'C')
+        ) STORED
+        """
+    )
+    op.create_index(
+        "ix_applications_search_vector",
+        "applications",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_applications_search_vector", table_name="applications")
+    op.drop_column("applications", "search_vector")
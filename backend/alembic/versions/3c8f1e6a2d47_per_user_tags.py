@@ -0,0 +1,96 @@
+"""per_user_tags
+
+Revision ID: 3c8f1e6a2d47
+Revises: 0a7e4c2d9b13
+Create Date: 2026-10-18 20:05:39.126550
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3c8f1e6a2d47"
+down_revision: Union[str, Sequence[str], None] = "0a7e4c2d9b13"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("tags", sa.Column("user_id", sa.String(), nullable=True))
+    op.drop_constraint("tags_name_key", "tags", type_="unique")
+    op.drop_index("ix_tags_lower_name", table_name="tags")
+
+    # every user that uses a global tag gets a private copy of it; names that
+    # only differ in case collapse into one tag per user
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE tag_owners ON COMMIT DROP AS
+        WITH used AS (
+            SELECT DISTINCT t.id AS old_id, t.name, a.user_id
+            FROM tags t
+            JOIN application_tags l ON l.tag_id = t.id
+            JOIN applications a ON a.id = l.application_id
+        ),
+        copies AS (
+            SELECT user_id, lower(name) AS lname, min(name) AS name,
+                   gen_random_uuid()::text AS new_id
+            FROM used GROUP BY user_id, lower(name)
+        )
+        SELECT used.old_id, used.user_id, copies.new_id, copies.name
+        FROM used JOIN copies ON copies.user_id = used.user_id AND copies.lname = lower(used.name)
+        """
+    )
+    op.execute(
+        "INSERT INTO tags (id, name, user_id) SELECT DISTINCT new_id, name, user_id FROM tag_owners"
+    )
+    op.execute(
+        """
+        INSERT INTO application_tags (application_id, tag_id)
+        SELECT l.application_id, o.new_id
+        FROM application_tags l
+        JOIN applications a ON a.id = l.application_id
+        JOIN tag_owners o ON o.old_id = l.tag_id AND o.user_id = a.user_id
+        ON CONFLICT DO NOTHING
+        """
+    )
+    # the global originals (and, by cascade, their links) go; unused ones had no owner
+    op.execute("DELETE FROM tags WHERE user_id IS NULL")
+
+    op.alter_column("tags", "user_id", nullable=False)
+    op.create_foreign_key("tags_user_id_fkey", "tags", "users", ["user_id"], ["id"])
+    op.create_index(
+        "uq_tags_user_lower_name", "tags", ["user_id", sa.text("lower(name)")], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("uq_tags_user_lower_name", table_name="tags")
+    op.drop_constraint("tags_user_id_fkey", "tags", type_="foreignkey")
+    # merge same-named tags back into one global tag per name
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE tag_merge ON COMMIT DROP AS
+        SELECT id AS old_id, min(id) OVER (PARTITION BY name) AS keep_id FROM tags
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO application_tags (application_id, tag_id)
+        SELECT l.application_id, m.keep_id
+        FROM application_tags l JOIN tag_merge m ON m.old_id = l.tag_id
+        WHERE m.old_id <> m.keep_id
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.execute(
+        "DELETE FROM tags WHERE id IN (SELECT old_id FROM tag_merge WHERE old_id <> keep_id)"
+    )
+    op.drop_column("tags", "user_id")
+    op.create_index("ix_tags_lower_name", "tags", [sa.text("lower(name)")])
+    op.create_unique_constraint("tags_name_key", "tags", ["name"])
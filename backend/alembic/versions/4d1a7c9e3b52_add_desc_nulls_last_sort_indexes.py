@@ -0,0 +1,58 @@
+"""add_desc_nulls_last_sort_indexes
+
+Revision ID: 4d1a7c9e3b52
+Revises: 7b2e9d4f1a63
+Create Date: 2026-10-18 22:03:51.740926
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4d1a7c9e3b52"
+down_revision: Union[str, Sequence[str], None] = "7b2e9d4f1a63"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# GET /applications lists nullable sort keys NULLS LAST in both directions;
+# Postgres can only serve "DESC NULLS LAST" from an index built that way
+# (SQLite sorts NULLs low, so its ascending indexes already cover it)
+INDEXES = [
+    ("last_update_at",),
+    ("applied_at",),
+    ("location",),
+    ("status", "last_update_at"),
+]
+
+
+def _name(cols: tuple[str, ...]) -> str:
+    return f"ix_applications_user_{'_'.join(cols)}_desc_id"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+    for cols in INDEXES:
+        op.create_index(
+            _name(cols),
+            "applications",
+            [
+                "user_id",
+                *cols[:-1],
+                sa.text(f"{cols[-1]} DESC NULLS LAST"),
+                sa.text("id DESC"),
+            ],
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+    for cols in INDEXES:
+        op.drop_index(_name(cols), table_name="applications")
@@ -0,0 +1,34 @@
+"""add_application_sort_indexes
+
+Revision ID: 5c2d8e4b7a10
+Revises: 1b6e3f0a9c21
+Create Date: 2026-10-18 10:02:37.540913
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c2d8e4b7a10"
+down_revision: Union[str, Sequence[str], None] = "1b6e3f0a9c21"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# keep in sync with SORTABLE_FIELDS in app/routers/applications.py
+SORT_COLUMNS = ("last_update_at", "applied_at", "company", "role", "status", "location")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for col in SORT_COLUMNS:
+        op.create_index(f"ix_applications_user_{col}_id", "applications", ["user_id", col, "id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for col in SORT_COLUMNS:
+        op.drop_index(f"ix_applications_user_{col}_id", table_name="applications")
@@ -0,0 +1,33 @@
+"""add_saved_view_tag_filter
+
+Revision ID: 7b2e9d4f1a63
+Revises: 3c8f1e6a2d47
+Create Date: 2026-10-18 21:12:08.417305
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7b2e9d4f1a63"
+down_revision: Union[str, Sequence[str], None] = "3c8f1e6a2d47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("saved_views", sa.Column("tag_ids", sa.JSON(), nullable=True))
+    op.add_column(
+        "saved_views", sa.Column("tag_mode", sa.String(), server_default="any", nullable=False)
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("saved_views", "tag_mode")
+    op.drop_column("saved_views", "tag_ids")
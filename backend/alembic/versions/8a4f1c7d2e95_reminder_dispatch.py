@@ -0,0 +1,43 @@
+"""reminder_dispatch
+
+Revision ID: 8a4f1c7d2e95
+Revises: 5c2d8e4b7a10
+Create Date: 2026-10-18 11:40:12.306551
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4f1c7d2e95"
+down_revision: Union[str, Sequence[str], None] = "5c2d8e4b7a10"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "reminders",
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("reminders", sa.Column("next_attempt_at", sa.DateTime(), nullable=True))
+    op.add_column("reminders", sa.Column("last_error", sa.Text(), nullable=True))
+    op.create_index(
+        "ix_reminders_due_unsent",
+        "reminders",
+        ["due_at"],
+        postgresql_where=sa.text("sent = false"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_reminders_due_unsent", table_name="reminders")
+    op.drop_column("reminders", "last_error")
+    op.drop_column("reminders", "next_attempt_at")
+    op.drop_column("reminders", "attempts")
@@ -0,0 +1,62 @@
+"""add_stat_counters
+
+Revision ID: b3e9d6a41f58
+Revises: 8a4f1c7d2e95
+Create Date: 2026-10-18 13:05:51.772014
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e9d6a41f58"
+down_revision: Union[str, Sequence[str], None] = "8a4f1c7d2e95"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "stat_counters",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("kind", sa.String(), nullable=False),
+        sa.Column("key", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id", "kind", "key"),
+    )
+    # backfill from existing rows; same keys as app/services/stats.py
+    op.execute(
+        """
+        INSERT INTO stat_counters (user_id, kind, key, count)
+        SELECT user_id, 'status', status::text, count(*)
+        FROM applications GROUP BY user_id, status
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO stat_counters (user_id, kind, key, count)
+        SELECT user_id, 'applied_week', to_char(date_trunc('week', applied_at), 'YYYY-MM-DD'),
+               count(*)
+        FROM applications WHERE applied_at IS NOT NULL
+        GROUP BY 1, 2, 3
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO stat_counters (user_id, kind, key, count)
+        SELECT a.user_id, 'stage', s.type::text, count(DISTINCT s.application_id)
+        FROM stages s JOIN applications a ON a.id = s.application_id
+        GROUP BY a.user_id, s.type
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("stat_counters")
@@ -0,0 +1,32 @@
+"""add_user_data_version
+
+Revision ID: d71c2a9e4f03
+Revises: b3e9d6a41f58
+Create Date: 2026-10-18 14:21:37.508216
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "d71c2a9e4f03"
+down_revision: Union[str, Sequence[str], None] = "b3e9d6a41f58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column("data_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "data_version")
@@ -0,0 +1,72 @@
+"""add_application_events
+
+Revision ID: e5a8b3c1d927
+Revises: d71c2a9e4f03
+Create Date: 2026-10-18 15:02:44.390117
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5a8b3c1d927"
+down_revision: Union[str, Sequence[str], None] = "d71c2a9e4f03"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "application_events",
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("application_id", sa.String(), nullable=False),
+        sa.Column("kind", sa.String(), nullable=False),
+        sa.Column("from_status", sa.String(), nullable=True),
+        sa.Column("to_status", sa.String(), nullable=True),
+        sa.Column("data", sa.JSON(), nullable=True),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_application_events_user_occurred",
+        "application_events",
+        ["user_id", "occurred_at", "id"],
+    )
+    op.create_index(
+        "ix_application_events_app_occurred",
+        "application_events",
+        ["application_id", "occurred_at"],
+    )
+    # seed history from what the mutable tables still know: one "created" per
+    # application and one "stage_added" per stage; earlier transitions are lost
+    op.execute(
+        """
+        INSERT INTO application_events (id, user_id, application_id, kind, to_status, occurred_at)
+        SELECT gen_random_uuid()::text, user_id, id, 'created', status::text,
+               coalesce(applied_at, last_update_at, now())
+        FROM applications
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO application_events (id, user_id, application_id, kind, data, occurred_at)
+        SELECT gen_random_uuid()::text, a.user_id, s.application_id, 'stage_added',
+               json_build_object('stage_id', s.id, 'type', s.type::text),
+               coalesce(s.created_at, now())
+        FROM stages s JOIN applications a ON a.id = s.application_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_application_events_app_occurred", table_name="application_events")
+    op.drop_index("ix_application_events_user_occurred", table_name="application_events")
+    op.drop_table("application_events")
@@ -0,0 +1,132 @@
+# app/compression.py
+import asyncio
+import zlib
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from .config import settings
+
+try:
+    import brotli
+except ImportError:  # optional: without it only gzip is offered
+    brotli = None
+
+# on a 100-item /applications page (~280 KB) both take ~5-7 ms for a ~7x
+# reduction; gzip 6 / brotli 6 roughly double the time for <10% smaller output
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 5
+OFFLOAD_SIZE = 64 * 1024  # compress bigger bodies in a thread, off the event loop
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/javascript")
+
+
+class _Gzip:
+    name = "gzip"
+
+    def __init__(self):
+        self._c = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes, final: bool = False) -> bytes:
+        # sync-flush each streamed chunk so clients can decode it right away
+        return self._c.compress(data) + self._c.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class _Brotli:
+    name = "br"
+
+    def __init__(self):
+        self._c = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def compress(self, data: bytes, final: bool = False) -> bytes:
+        out = self._c.process(data)
+        return out + (self._c.finish() if final else self._c.flush())
+
+
+def negotiate(accept_encoding: str) -> type[_Gzip] | type[_Brotli] | None:
+    """Pick br or gzip from an Accept-Encoding header, honouring q-values."""
+    prefs: dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        prefs[coding.strip()] = q
+    default = prefs.get("*", 0.0)
+    candidates: list[tuple[type[_Gzip] | type[_Brotli], str]] = []
+    if brotli is not None:
+        candidates.append((_Brotli, "br"))
+    candidates.append((_Gzip, "gzip"))
+    best = max(candidates, key=lambda c: prefs.get(c[1], default))
+    return best[0] if prefs.get(best[1], default) > 0 else None
+
+
+class CompressionMiddleware:
+    """Negotiated br/gzip for JSON and text responses of at least COMPRESS_MIN_SIZE bytes.
+
+    Single-body responses are compressed in one go; streamed responses (export)
+    are compressed chunk by chunk regardless of size.
+    """
+
+    def __init__(self, app, minimum_size: int | None = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESS_MIN_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+        encoder_cls = negotiate(Headers(scope=scope).get("accept-encoding", ""))
+        if encoder_cls is None:
+            return await self.app(scope, receive, send)
+
+        start = None
+        encoder = None
+
+        async def send_compressed(message):
+            nonlocal start, encoder
+            if message["type"] == "http.response.start":
+                start = message  # held until the first body chunk shows the size
+                return
+            if message["type"] != "http.response.body" or start is None:
+                return await send(message)
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if encoder is None:
+                headers = MutableHeaders(raw=list(start["headers"]))
+                content_type = headers.get("content-type", "")
+                if (
+                    "content-encoding" in headers
+                    or not content_type.startswith(COMPRESSIBLE_TYPES)
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    if content_type.startswith(COMPRESSIBLE_TYPES):
+                        headers.add_vary_header("Accept-Encoding")
+                    await send({**start, "headers": headers.raw})
+                    start = None  # pass the rest of this response through untouched
+                    return await send(message)
+
+                encoder = encoder_cls()
+                headers["content-encoding"] = encoder.name
+                headers.add_vary_header("Accept-Encoding")
+                # the compressed bytes are a different representation: weaken
+                # the validator (http_cache still matches it on If-None-Match)
+                etag = headers.get("etag")
+                if etag and not etag.startswith("W/"):
+                    headers["etag"] = f"W/{etag}"
+                del headers["content-length"]
+                if not more_body:
+                    if len(body) >= OFFLOAD_SIZE:
+                        body = await asyncio.to_thread(encoder.compress, body, True)
+                    else:
+                        body = encoder.compress(body, final=True)
+                    headers["content-length"] = str(len(body))
+                    await send({**start, "headers": headers.raw})
+                    return await send({"type": "http.response.body", "body": body})
+                await send({**start, "headers": headers.raw})
+
+            chunk = encoder.compress(body, final=not more_body)
+            await send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
@@ -8,6 +8,82 @@ class Settings(BaseSettings):
     ALLOWED_ORIGINS: str = "http://localhost:5173"
     LOG_LEVEL: str = "info"
 
+    # connection pool (ignored for SQLite)
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 10.0  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds; drop connections older than this
+    DB_POOL_PRE_PING: bool = True  # detect connections killed by a failover
+    DB_STATEMENT_TIMEOUT_MS: int = 15000  # Postgres statement_timeout; 0 disables
+
+    # per-request SQL instrumentation
+    SQL_STATEMENT_BUDGET: int = 25  # warn when a request issues more statements than this
+    SQL_REPEAT_WARN_THRESHOLD: int = 5  # warn when one statement repeats this often (N+1)
+
+    # password hashing
+    BCRYPT_ROUNDS: int = 12  # changing this rehashes users' passwords on next login
+    PASSWORD_HASH_WORKERS: int = 2  # dedicated threads for bcrypt
+    PASSWORD_HASH_MAX_PENDING: int = 16  # running + queued before /auth returns 429
+
+    # authenticated-user cache used by get_current_user
+    AUTH_CACHE_TTL_SECONDS: int = 60
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+    AUTH_TRUST_TOKEN_CLAIMS: bool = False  # build the user from JWT claims, no DB lookup
+
+    # HTTP caching
+    COMPRESS_MIN_SIZE: int = 1024  # bytes; smaller bodies are sent uncompressed
+
+    # saved views: result id lists cached per user (app/services/views.py)
+    SAVED_VIEW_CACHE_TTL_SECONDS: int = 600
+    SAVED_VIEW_CACHE_MAX_USERS: int = 10000
+    SAVED_VIEW_MAX_CACHED_IDS: int = 5000  # larger results are re-queried on every open
+
+    # per-user tag lists with usage counts (app/services/tags.py)
+    TAG_CACHE_TTL_SECONDS: int = 600
+    TAG_CACHE_MAX_USERS: int = 10000
+
+    # realtime change feed (Socket.IO at /socket.io)
+    REALTIME_BUS_URL: str = ""  # redis://... to fan out across processes; empty = in-process
+
+    # rate limiting (app/ratelimit.py); budgets are "<count>/<second|minute|hour>" per client
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_DEFAULT: str = "300/minute"  # shared by every route without its own rule
+    RATE_LIMITS: dict[str, str] = {
+        "/auth/login": "10/minute",
+        "/auth/register": "5/minute",
+        "GET /applications/search": "30/minute",
+        "POST /applications/import": "10/minute",
+        "GET /export": "10/minute",
+    }
+    RATE_LIMIT_STORE_URL: str = ""  # redis://... to share buckets across workers; empty = local
+    RATE_LIMIT_MAX_KEYS: int = 100000  # in-process buckets kept before the least recent is dropped
+    RATE_LIMIT_TRUST_FORWARDED_FOR: bool = False  # key /auth by X-Forwarded-For (behind a proxy)
+
+    # background reminder dispatcher
+    REMINDER_DISPATCH_ENABLED: bool = False  # run the dispatcher inside the API process
+    REMINDER_POLL_SECONDS: float = 30.0
+    REMINDER_BATCH_SIZE: int = 100
+    REMINDER_MAX_ATTEMPTS: int = 5
+    REMINDER_RETRY_BASE_SECONDS: int = 60  # doubled after every failed attempt
+    # how long a claimed reminder stays hidden from other workers while it is delivered;
+    # must outlast delivering a whole batch
+    REMINDER_CLAIM_LEASE_SECONDS: int = 1800
+    REMINDER_NOTIFIER: str = "file"  # "file" | "smtp"
+    REMINDER_OUTBOX_PATH: str = "reminders.outbox.jsonl"
+    SMTP_HOST: str = "localhost"
+    SMTP_PORT: int = 25
+    SMTP_FROM: str = "reminders@jobtracker.local"
+
+    # document storage
+    AWS_REGION: str = ""
+    AWS_S3_BUCKET: str = ""
+    AWS_S3_ENDPOINT_URL: str = ""  # e.g. http://localhost:9000 for MinIO / moto_server
+    S3_MAX_POOL_CONNECTIONS: int = 32
+    PRESIGN_EXPIRES_SECONDS: int = 3600
+    PRESIGN_CACHE_MARGIN_SECONDS: int = 300  # stop reusing a cached URL this long before expiry
+    PRESIGN_CACHE_MAX_ENTRIES: int = 10000
+    PRESIGN_BATCH_MAX: int = 50
+
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 from .config import settings
 
@@ -7,5 +9,44 @@ class Base(DeclarativeBase):
     pass
 
 
-engine = create_engine(settings.DATABASE_URL, future=True)
+def _async_url(url: str):
+    # same database, async driver: psycopg2 -> asyncpg, pysqlite -> aiosqlite
+    u = make_url(url)
+    if u.get_backend_name() == "postgresql":
+        return u.set(drivername="postgresql+asyncpg")
+    if u.get_backend_name() == "sqlite":
+        return u.set(drivername="sqlite+aiosqlite")
+    return u
+
+
+def _engine_options(url, is_async: bool) -> dict:
+    u = make_url(url)
+    if u.get_backend_name() != "postgresql":
+        return {}
+    opts: dict = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    timeout = settings.DB_STATEMENT_TIMEOUT_MS
+    if timeout > 0:
+        if is_async:
+            opts["connect_args"] = {"server_settings": {"statement_timeout": str(timeout)}}
+        else:
+            opts["connect_args"] = {"options": f"-c statement_timeout={timeout}"}
+    return opts
+
+
+# sync engine: Alembic, scripts and one-off maintenance only
+engine = create_engine(
+    settings.DATABASE_URL, future=True, **_engine_options(settings.DATABASE_URL, False)
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# async engine: used by the API request path
+async_engine = create_async_engine(
+    _async_url(settings.DATABASE_URL), **_engine_options(settings.DATABASE_URL, True)
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
@@ -1,31 +1,78 @@
-from typing import Generator
+import time
+from typing import AsyncGenerator
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from .db import SessionLocal
+from .cache import TTLCache
+from .config import settings
+from .db import AsyncSessionLocal, async_engine
+from .metrics import DB_POOL_WAIT
 from .security import decode_token
 from .models import User
 
 
-def get_db() -> Generator:
-    db = SessionLocal()
-    try:
+# Sessions check out a connection lazily, on the first execute or flush after
+# (auto)begin. Stamp each of those and let after_begin, which only fires once a
+# connection has been checked out, observe how long the checkout took.
+@event.listens_for(Session, "do_orm_execute")
+def _stamp_execute(orm_execute_state) -> None:
+    orm_execute_state.session.info["checkout_start"] = time.perf_counter()
+
+
+@event.listens_for(Session, "before_flush")
+def _stamp_flush(session, flush_context, instances) -> None:
+    session.info["checkout_start"] = time.perf_counter()
+
+
+@event.listens_for(Session, "after_begin")
+def _observe_pool_wait(session, transaction, connection) -> None:
+    start = session.info.pop("checkout_start", None)
+    if start is not None and connection.engine is async_engine.sync_engine:
+        DB_POOL_WAIT.observe(time.perf_counter() - start)
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 bearer = HTTPBearer()
 
+# user id -> (email, name) for users verified against the DB recently
+_principals = TTLCache(settings.AUTH_CACHE_MAX_ENTRIES, settings.AUTH_CACHE_TTL_SECONDS)
 
-def get_current_user(
-    creds: HTTPAuthorizationCredentials = Depends(bearer), db: Session = Depends(get_db)
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_principal(mapper, connection, target: User) -> None:
+    _principals.pop(target.id)
+
+
+def _principal(uid: str, email: str, name: str | None) -> User:
+    # a fresh, session-less User per request so nothing is shared between requests
+    return User(id=uid, email=email, name=name)
+
+
+async def get_current_user(
+    creds: HTTPAuthorizationCredentials = Depends(bearer),
+    db: AsyncSession = Depends(get_db),
 ) -> User:
     try:
-        uid = decode_token(creds.credentials).get("sub")
+        claims = decode_token(creds.credentials)
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid token")
-    user = db.query(User).filter(User.id == uid).first()
+    uid = claims.get("sub")
+    if not uid:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    if settings.AUTH_TRUST_TOKEN_CLAIMS and "email" in claims:
+        return _principal(uid, claims["email"], claims.get("name"))
+    cached = _principals.get(uid)
+    if cached is not None:
+        return _principal(uid, *cached)
+    user = await db.get(User, uid)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
+    _principals.set(uid, (user.email, user.name))
     return user
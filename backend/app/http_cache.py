@@ -0,0 +1,55 @@
+# app/http_cache.py
+import hashlib
+import hmac
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .config import settings
+from .services import versions
+
+# revalidate on every use; a 304 costs one primary-key lookup
+REVALIDATE = "private, no-cache"
+
+
+def _etag(request: Request, scope: str, version: int) -> str:
+    # keyed on the full URL so different filters/pages get different tags, and
+    # signed so a client cannot mint a tag for a resource it never fetched
+    query = "&".join(sorted(request.url.query.split("&")))
+    msg = f"{scope}:{version}:{request.url.path}?{query}".encode()
+    digest = hmac.new(settings.JWT_SECRET.encode(), msg, hashlib.sha256).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def _matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    # weak comparison, as RFC 9110 requires for If-None-Match
+    tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def conditional(
+    request: Request,
+    response: Response,
+    scope: str,
+    version: int,
+) -> Response | None:
+    """Answer 304 when the client's copy is current, else stamp `response` with validators.
+
+    Call before loading anything: on a match the route returns the 304 as is,
+    skipping the ORM and response-model serialization entirely.
+    """
+    etag = _etag(request, scope, version)
+    headers = {"ETag": etag, "Cache-Control": REVALIDATE, "Vary": "Authorization"}
+    if _matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+async def user_conditional(
+    request: Request, response: Response, db: AsyncSession, user_id: str
+) -> Response | None:
+    """`conditional` keyed on the user's data_version (see services/versions.py)."""
+    return conditional(request, response, f"user:{user_id}", await versions.current(db, user_id))
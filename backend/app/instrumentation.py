@@ -0,0 +1,109 @@
+# app/instrumentation.py
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+
+from .config import settings
+from .db import async_engine
+from .metrics import HTTP_DB_ROWS, HTTP_DB_SECONDS, HTTP_DB_STATEMENTS
+
+log = logging.getLogger("app.sql")
+
+
+@dataclass
+class RequestSQLStats:
+    statements: int = 0
+    seconds: float = 0.0
+    rows: int = 0
+    by_statement: Counter = field(default_factory=Counter)
+
+
+_current: ContextVar[RequestSQLStats | None] = ContextVar("request_sql_stats", default=None)
+
+
+def current_sql_stats() -> RequestSQLStats | None:
+    return _current.get()
+
+
+@event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+def _before_execute(conn, cursor, statement, parameters, context, executemany):
+    # per-statement context, so a statement that raises leaves nothing behind
+    context._query_start = time.perf_counter()
+
+
+@event.listens_for(async_engine.sync_engine, "after_cursor_execute")
+def _after_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._query_start
+    stats = _current.get()
+    if stats is None:
+        return
+    stats.statements += 1
+    stats.seconds += elapsed
+    stats.by_statement[statement] += 1
+    # SQLite reports -1 for SELECTs; Postgres drivers report the real count
+    if cursor.rowcount and cursor.rowcount > 0:
+        stats.rows += cursor.rowcount
+
+
+class SQLInstrumentationMiddleware:
+    """Counts SQL statements, DB time and rows per request.
+
+    Adds a Server-Timing header, feeds the per-route Prometheus histograms and
+    logs requests that exceed SQL_STATEMENT_BUDGET or repeat one statement
+    SQL_REPEAT_WARN_THRESHOLD times (the usual N+1 signature).
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = RequestSQLStats()
+        token = _current.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                timing = f'db;dur={stats.seconds * 1000:.1f};desc="{stats.statements} queries"'
+                headers.append((b"server-timing", timing.encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            self._record(scope, stats)
+
+    def _record(self, scope, stats: RequestSQLStats) -> None:
+        route = scope.get("route")
+        if route is None:
+            return  # 404s / mounts: no stable label
+        path, method = route.path, scope["method"]
+        HTTP_DB_STATEMENTS.labels(method, path).observe(stats.statements)
+        HTTP_DB_SECONDS.labels(method, path).observe(stats.seconds)
+        HTTP_DB_ROWS.labels(method, path).observe(stats.rows)
+        if stats.statements > settings.SQL_STATEMENT_BUDGET:
+            log.warning(
+                "%s %s issued %d SQL statements (budget %d)",
+                method,
+                path,
+                stats.statements,
+                settings.SQL_STATEMENT_BUDGET,
+            )
+        if stats.by_statement:
+            statement, repeats = stats.by_statement.most_common(1)[0]
+            if repeats >= settings.SQL_REPEAT_WARN_THRESHOLD:
+                log.warning(
+                    "%s %s repeated one statement %d times (possible N+1): %s",
+                    method,
+                    path,
+                    repeats,
+                    " ".join(statement.split())[:200],
+                )
@@ -1,5 +1,16 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from .compression import CompressionMiddleware
+from .config import settings
+from .instrumentation import SQLInstrumentationMiddleware
+from .metrics import metrics_response
+from .ratelimit import RateLimitMiddleware
+from .realtime import asgi_app as realtime_app
+from .services.reminders import run_dispatcher
 from .routers import (
     auth,
     applications,
@@ -9,25 +20,56 @@ from .routers import (
     stages,
     reminders,
     tags,
+    export,
+    stats,
+    activity,
+    views,
 )
 
 
-app = FastAPI(title="Job Tracker API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    stop = asyncio.Event()
+    task = None
+    if settings.REMINDER_DISPATCH_ENABLED:
+        task = asyncio.create_task(run_dispatcher(stop))
+    yield
+    stop.set()
+    if task:
+        await task
+
+
+# orjson renders the dicts Pydantic dumps for each response_model several times
+# faster than the stdlib encoder, which matters for jd_text-heavy lists
+app = FastAPI(title="Job Tracker API", lifespan=lifespan, default_response_class=ORJSONResponse)
 
+# inside CORS so preflights skip it and 429s still carry CORS headers
+app.add_middleware(RateLimitMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
+app.add_middleware(SQLInstrumentationMiddleware)
+app.add_middleware(CompressionMiddleware)
 
 
 @app.get("/health")
-def health():
+async def health():
     return {"ok": True}
 
 
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    return metrics_response()
+
+
+# Socket.IO change feed (see app/realtime.py)
+app.mount("/socket.io", realtime_app)
+
 app.include_router(documents.router)
 app.include_router(auth.router)
 app.include_router(applications.router)
@@ -36,4 +78,8 @@ app.include_router(contacts.router)
 app.include_router(stages.router)
 app.include_router(reminders.router)
 app.include_router(tags.router)
+app.include_router(export.router)
+app.include_router(stats.router)
+app.include_router(activity.router)
+app.include_router(views.router)
 app.include_router(documents.router)
@@ -0,0 +1,59 @@
+# app/metrics.py
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest
+from fastapi import Response
+
+from .db import async_engine
+
+
+def _pool_stat(name: str):
+    # StaticPool/NullPool (SQLite, tests) don't track these; report 0
+    def read() -> float:
+        fn = getattr(async_engine.pool, name, None)
+        # QueuePool.overflow() is negative while below pool_size
+        return float(max(fn(), 0)) if callable(fn) else 0.0
+
+    return read
+
+
+DB_POOL_SIZE = Gauge("db_pool_size", "Configured connection pool size")
+DB_POOL_SIZE.set_function(_pool_stat("size"))
+DB_POOL_CHECKED_OUT = Gauge("db_pool_checked_out", "Connections currently checked out")
+DB_POOL_CHECKED_OUT.set_function(_pool_stat("checkedout"))
+DB_POOL_OVERFLOW = Gauge("db_pool_overflow", "Connections open beyond pool_size")
+DB_POOL_OVERFLOW.set_function(_pool_stat("overflow"))
+DB_POOL_WAIT = Histogram(
+    "db_pool_wait_seconds",
+    "Time a request waited to check out a DB connection",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10),
+)
+
+
+HTTP_DB_STATEMENTS = Histogram(
+    "http_request_db_statements",
+    "SQL statements issued per request",
+    ["method", "route"],
+    buckets=(1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+HTTP_DB_SECONDS = Histogram(
+    "http_request_db_seconds",
+    "Time spent executing SQL per request",
+    ["method", "route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+HTTP_DB_ROWS = Histogram(
+    "http_request_db_rows",
+    "Rows reported by the driver per request",
+    ["method", "route"],
+    buckets=(0, 1, 10, 100, 1000, 10000),
+)
+
+
+RATE_LIMIT_REQUESTS = Counter(
+    "rate_limit_requests",
+    "Rate limit decisions by rule; outcome is allowed, limited or error (store down)",
+    ["rule", "outcome"],
+)
+
+
+def metrics_response() -> Response:
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
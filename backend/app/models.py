@@ -2,8 +2,28 @@ import enum
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import String, DateTime, Enum as SAEnum, ForeignKey, Boolean, Text, Table, Column
+from sqlalchemy import (
+    DDL,
+    Computed,
+    String,
+    DateTime,
+    Enum as SAEnum,
+    ForeignKey,
+    Boolean,
+    Text,
+    Table,
+    Column,
+    Index,
+    Integer,
+    JSON,
+    UniqueConstraint,
+    event,
+    text,
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import Mapped, mapped_column, relationship, column_property
+from sqlalchemy.schema import CreateColumn
 
 from .db import Base
 
@@ -23,6 +43,8 @@ application_tags = Table(
     Base.metadata,
     Column("application_id", ForeignKey("applications.id"), primary_key=True),
     Column("tag_id", ForeignKey("tags.id"), primary_key=True),
+    # the primary key only serves lookups by application; this one serves "apps with tag X"
+    Index("ix_application_tags_tag_application", "tag_id", "application_id"),
 )
 
 
@@ -33,6 +55,8 @@ class User(Base):
     email: Mapped[str] = mapped_column(String, unique=True, index=True)
     name: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     password_hash: Mapped[str] = mapped_column(String)
+    # bumped on every write to the user's data; HTTP ETags are derived from it
+    data_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
 
     applications: Mapped[List["Application"]] = relationship(
         back_populates="user", cascade="all, delete-orphan"
@@ -41,13 +65,56 @@ class User(Base):
 
 class Application(Base):
     __tablename__ = "applications"
+    # (user_id, sort key, id) indexes back keyset pagination on GET /applications;
+    # every query is scoped to a user, so they also stand in for a user_id index
+    __table_args__ = (
+        *(
+            Index(f"ix_applications_user_{col}_id", "user_id", col, "id")
+            for col in ("last_update_at", "applied_at", "company", "role", "status", "location")
+        ),
+        # status filter + default sort; covers the id-only saved view query
+        Index(
+            "ix_applications_user_status_last_update_at_id",
+            "user_id",
+            "status",
+            "last_update_at",
+            "id",
+        ),
+        Index("ix_applications_search_vector", "search_vector", postgresql_using="gin").ddl_if(
+            dialect="postgresql"
+        ),
+        # nullable sort keys list NULLs last both ways. Postgres sorts NULLs
+        # high, so a backward scan of the indexes above yields DESC NULLS
+        # FIRST; these serve DESC NULLS LAST (SQLite's natural DESC order)
+        *(
+            Index(
+                f"ix_applications_user_{'_'.join(cols)}_desc_id",
+                "user_id",
+                *cols[:-1],
+                text(f"{cols[-1]} DESC NULLS LAST"),
+                text("id DESC"),
+            ).ddl_if(dialect="postgresql")
+            for cols in (
+                ("last_update_at",),
+                ("applied_at",),
+                ("location",),
+                ("status", "last_update_at"),
+            )
+        ),
+    )
+
+    # don't RETURNING the generated search_vector after every write; it is only
+    # ever read by search queries (and does not exist outside Postgres)
+    __mapper_args__ = {"eager_defaults": False}
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), index=True)
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
     company: Mapped[str] = mapped_column(String)
     role: Mapped[str] = mapped_column(String)
     location: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     source: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    salary_min: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    salary_max: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     status: Mapped[Status] = mapped_column(SAEnum(Status), default=Status.APPLIED)
     job_url: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     jd_text: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # used in routers
@@ -55,6 +122,21 @@ class Application(Base):
     last_update_at: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # full-text search (app/services/search.py). Postgres only: a generated,
+    # GIN-indexed tsvector weighting company/role hits above location and the
+    # job description. Deferred so list queries never read it.
+    search_vector: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(company, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(role, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(location, '')), 'B') || "
+            "setweight(to_tsvector('english', coalesce(jd_text, '')), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+        info={"postgresql_only": True},
+    )
 
     user: Mapped["User"] = relationship(back_populates="applications")
 
@@ -78,6 +160,50 @@ class Application(Base):
     )
 
 
+@compiles(CreateColumn)
+def _create_column(element, compiler, **kw):
+    # leave Postgres-only columns (see Application.search_vector) out of
+    # CREATE TABLE elsewhere
+    if element.element.info.get("postgresql_only") and compiler.dialect.name != "postgresql":
+        return None
+    return compiler.visit_create_column(element, **kw)
+
+
+# SQLite (tests / local dev) searches an external-content FTS5 table kept in
+# sync by triggers instead
+_SQLITE_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS applications_fts USING fts5(
+        company, role, location, jd_text,
+        content='applications', content_rowid='rowid'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_ai AFTER INSERT ON applications BEGIN
+        INSERT INTO applications_fts(rowid, company, role, location, jd_text)
+        VALUES (new.rowid, new.company, new.role, new.location, new.jd_text);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_ad AFTER DELETE ON applications BEGIN
+        INSERT INTO applications_fts(applications_fts, rowid, company, role, location, jd_text)
+        VALUES ('delete', old.rowid, old.company, old.role, old.location, old.jd_text);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS applications_fts_au AFTER UPDATE ON applications BEGIN
+        INSERT INTO applications_fts(applications_fts, rowid, company, role, location, jd_text)
+        VALUES ('delete', old.rowid, old.company, old.role, old.location, old.jd_text);
+        INSERT INTO applications_fts(rowid, company, role, location, jd_text)
+        VALUES (new.rowid, new.company, new.role, new.location, new.jd_text);
+    END
+    """,
+]
+
+for _stmt in _SQLITE_FTS_DDL:
+    event.listen(Application.__table__, "after_create", DDL(_stmt).execute_if(dialect="sqlite"))
+
+
 class Document(Base):
     __tablename__ = "documents"
 
@@ -103,9 +229,10 @@ class StageType(str, enum.Enum):
 
 class Stage(Base):
     __tablename__ = "stages"
+    __table_args__ = (Index("ix_stages_application_created", "application_id", "created_at"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    application_id: Mapped[str] = mapped_column(ForeignKey("applications.id"), index=True)
+    application_id: Mapped[str] = mapped_column(ForeignKey("applications.id"))
     type: Mapped[StageType] = mapped_column(SAEnum(StageType))
     scheduled_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     outcome: Mapped[Optional[str]] = mapped_column(String, nullable=True)
@@ -131,9 +258,10 @@ class Contact(Base):
 
 class Note(Base):
     __tablename__ = "notes"
+    __table_args__ = (Index("ix_notes_application_created", "application_id", "created_at"),)
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    application_id: Mapped[str] = mapped_column(ForeignKey("applications.id"), index=True)
+    application_id: Mapped[str] = mapped_column(ForeignKey("applications.id"))
     user_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
     content: Mapped[str] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
@@ -143,22 +271,100 @@ class Note(Base):
 
 class Reminder(Base):
     __tablename__ = "reminders"
+    # the dispatcher only ever scans unsent reminders by due date
+    __table_args__ = (
+        Index(
+            "ix_reminders_due_unsent",
+            "due_at",
+            postgresql_where=text("sent = false"),
+            sqlite_where=text("sent = 0"),
+        ),
+        Index("ix_reminders_application_due", "application_id", "due_at"),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    application_id: Mapped[str] = mapped_column(ForeignKey("applications.id"), index=True)
+    application_id: Mapped[str] = mapped_column(ForeignKey("applications.id"))
     due_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     message: Mapped[str] = mapped_column(Text)
     sent: Mapped[bool] = mapped_column(Boolean, default=False)
+    # delivery bookkeeping for the background dispatcher
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    next_attempt_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     application: Mapped["Application"] = relationship(back_populates="reminders")
 
 
 class Tag(Base):
     __tablename__ = "tags"
+    # tags belong to one user; names are unique per user, ignoring case
+    __table_args__ = (
+        Index("uq_tags_user_lower_name", "user_id", text("lower(name)"), unique=True),
+    )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    name: Mapped[str] = mapped_column(String, unique=True)
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
+    name: Mapped[str] = mapped_column(String)
 
     applications: Mapped[List["Application"]] = relationship(
         secondary=application_tags, back_populates="tags"
     )
+
+
+class StatCounter(Base):
+    """Per-user dashboard counters, kept current by the routers that write
+    applications and stages (see app/services/stats.py)."""
+
+    __tablename__ = "stat_counters"
+
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    kind: Mapped[str] = mapped_column(String, primary_key=True)  # status | applied_week | stage
+    key: Mapped[str] = mapped_column(String, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class ApplicationEvent(Base):
+    """Append-only history of an application (see app/services/timeline.py).
+
+    application_id is deliberately not a foreign key: events outlive the
+    application so the activity feed can still show deletions.
+    """
+
+    __tablename__ = "application_events"
+    __table_args__ = (
+        Index("ix_application_events_user_occurred", "user_id", "occurred_at", "id"),
+        Index("ix_application_events_app_occurred", "application_id", "occurred_at"),
+    )
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
+    application_id: Mapped[str] = mapped_column(String)
+    kind: Mapped[str] = mapped_column(String)  # created | updated | status_changed | ...
+    from_status: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    to_status: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    data: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    occurred_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+
+
+class SavedView(Base):
+    """A named ApplicationQuery filter; its result ids are cached by app/services/views.py."""
+
+    __tablename__ = "saved_views"
+    __table_args__ = (UniqueConstraint("user_id", "name", name="uq_saved_views_user_name"),)
+
+    id: Mapped[str] = mapped_column(String, primary_key=True)
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), index=True)
+    name: Mapped[str] = mapped_column(String)
+    status: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    company: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    role: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    q: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    sort: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    tag_ids: Mapped[Optional[list]] = mapped_column(JSON, nullable=True)
+    tag_mode: Mapped[str] = mapped_column(String, default="any", server_default="any")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=datetime.utcnow, onupdate=datetime.utcnow
+    )
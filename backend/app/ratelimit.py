@@ -0,0 +1,197 @@
+# app/ratelimit.py
+import logging
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import orjson
+
+from .config import settings
+from .metrics import RATE_LIMIT_REQUESTS
+from .security import decode_token
+
+log = logging.getLogger(__name__)
+
+_PERIODS = {"second": 1, "minute": 60, "hour": 3600}
+
+# never throttled: probes, scrapes and the websocket feed (which has its own auth)
+EXEMPT_PREFIXES = ("/health", "/metrics", "/socket.io")
+
+
+@dataclass(frozen=True)
+class Limit:
+    burst: int  # bucket capacity
+    rate: float  # tokens refilled per second
+
+
+def parse_limit(spec: str) -> Limit:
+    """Parse "30/minute" into a bucket of 30 tokens refilled over a minute."""
+    count, _, period = spec.partition("/")
+    seconds = _PERIODS[period.strip().rstrip("s") or "second"]
+    return Limit(burst=int(count), rate=int(count) / seconds)
+
+
+class MemoryBucketStore:
+    """Token buckets in a process-local LRU dict.
+
+    take() never awaits between reading and writing a bucket, so the event loop
+    makes each update atomic without a lock. Evicting a bucket only refills it.
+    """
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    async def take(self, key: str, limit: Limit) -> float:
+        """Spend one token; returns 0 if allowed, else seconds until one is available."""
+        now = time.monotonic()
+        tokens, stamp = self._buckets.get(key, (limit.burst, now))
+        tokens = min(limit.burst, tokens + (now - stamp) * limit.rate)
+        wait = 0.0
+        if tokens >= 1:
+            tokens -= 1
+        else:
+            wait = (1 - tokens) / limit.rate
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        if len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+# same algorithm as MemoryBucketStore, run atomically inside Redis
+_TAKE_SCRIPT = """
+local burst, rate, now = tonumber(ARGV[1]), tonumber(ARGV[2]), tonumber(ARGV[3])
+local b = redis.call('HMGET', KEYS[1], 'tokens', 'stamp')
+local tokens = tonumber(b[1]) or burst
+local stamp = tonumber(b[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - stamp) * rate)
+local wait = 0
+if tokens >= 1 then tokens = tokens - 1 else wait = (1 - tokens) / rate end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'stamp', tostring(now))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(wait)
+"""
+
+
+class RedisBucketStore:
+    """Token buckets shared by every API worker through any Redis-compatible server."""
+
+    def __init__(self, url: str):
+        import redis.asyncio as redis
+
+        self._redis = redis.from_url(url)
+        self._take = self._redis.register_script(_TAKE_SCRIPT)
+
+    async def take(self, key: str, limit: Limit) -> float:
+        # wall clock rather than monotonic: the stamp is compared across processes
+        wait = await self._take(
+            keys=[f"ratelimit:{key}"], args=[limit.burst, limit.rate, time.time()]
+        )
+        return float(wait)
+
+
+def _store():
+    if settings.RATE_LIMIT_STORE_URL:
+        return RedisBucketStore(settings.RATE_LIMIT_STORE_URL)
+    return MemoryBucketStore(settings.RATE_LIMIT_MAX_KEYS)
+
+
+def _rules() -> list[tuple[str | None, str, Limit]]:
+    # "GET /applications/search" or "/auth/login"; longest prefix wins
+    rules = []
+    for pattern, spec in settings.RATE_LIMITS.items():
+        method, _, prefix = pattern.rpartition(" ")
+        rules.append((method.upper() or None, prefix, parse_limit(spec)))
+    return sorted(rules, key=lambda r: (len(r[1]), r[0] is not None), reverse=True)
+
+
+class RateLimitMiddleware:
+    """Per-client token-bucket throttling with per-route budgets from RATE_LIMITS.
+
+    Authenticated requests are keyed by the token's user id, the same id
+    get_current_user resolves; /auth/* and anonymous requests by client IP.
+    Each rule has its own bucket, and routes without a rule share
+    RATE_LIMIT_DEFAULT. Throttled requests get a 429 with Retry-After.
+    """
+
+    def __init__(self, app, store=None):
+        self.app = app
+        self.store = store or _store()
+        self.rules = _rules()
+        self.default = parse_limit(settings.RATE_LIMIT_DEFAULT)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not settings.RATE_LIMIT_ENABLED
+            or scope["method"] == "OPTIONS"
+            or scope["path"].startswith(EXEMPT_PREFIXES)
+        ):
+            return await self.app(scope, receive, send)
+
+        rule, limit = self._match(scope["method"], scope["path"])
+        key = f"{rule}:{self._client(scope)}"
+        try:
+            wait = await self.store.take(key, limit)
+        except Exception:
+            # a broken shared store must not take the API down with it
+            log.exception("rate limit store failed; allowing request")
+            RATE_LIMIT_REQUESTS.labels(rule, "error").inc()
+            return await self.app(scope, receive, send)
+
+        if wait <= 0:
+            RATE_LIMIT_REQUESTS.labels(rule, "allowed").inc()
+            return await self.app(scope, receive, send)
+
+        RATE_LIMIT_REQUESTS.labels(rule, "limited").inc()
+        body = orjson.dumps({"detail": "Rate limit exceeded"})
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 429,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                    (b"retry-after", str(math.ceil(wait)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+    def _match(self, method: str, path: str) -> tuple[str, Limit]:
+        for rule_method, prefix, limit in self.rules:
+            if path.startswith(prefix) and rule_method in (None, method):
+                return f"{rule_method} {prefix}" if rule_method else prefix, limit
+        return "default", self.default
+
+    def _client(self, scope) -> str:
+        if not scope["path"].startswith("/auth/"):
+            user_id = self._user_id(scope)
+            if user_id:
+                return f"user:{user_id}"
+        return f"ip:{self._ip(scope)}"
+
+    @staticmethod
+    def _user_id(scope) -> str | None:
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                if scheme.lower() != "bearer":
+                    return None
+                try:
+                    return decode_token(token).get("sub")
+                except Exception:
+                    return None  # the route will 401; throttle it by IP meanwhile
+        return None
+
+    @staticmethod
+    def _ip(scope) -> str:
+        if settings.RATE_LIMIT_TRUST_FORWARDED_FOR:
+            for name, value in scope["headers"]:
+                if name == b"x-forwarded-for":
+                    # the address our own proxy saw; earlier entries are client-supplied
+                    return value.decode("latin-1").rsplit(",", 1)[-1].strip()
+        client = scope.get("client")
+        return client[0] if client else "unknown"
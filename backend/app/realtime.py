@@ -0,0 +1,61 @@
+# app/realtime.py
+import logging
+from typing import Iterable
+
+import socketio
+
+from .config import settings
+from .security import decode_token
+
+log = logging.getLogger(__name__)
+
+
+def _client_manager() -> socketio.AsyncManager:
+    # the manager is the fan-out bus: in-process by default; any Redis-compatible
+    # server (redis, valkey, a local stand-in) shares it between API workers and
+    # the standalone reminder runner
+    if settings.REALTIME_BUS_URL:
+        return socketio.AsyncRedisManager(settings.REALTIME_BUS_URL)
+    return socketio.AsyncManager()
+
+
+# CORS is left to the app's CORSMiddleware, which also wraps this mount
+sio = socketio.AsyncServer(
+    async_mode="asgi", cors_allowed_origins=[], client_manager=_client_manager()
+)
+asgi_app = socketio.ASGIApp(sio)
+
+
+def _room(user_id: str) -> str:
+    return f"user:{user_id}"
+
+
+@sio.event
+async def connect(sid, environ, auth):
+    # clients connect with io(url, { auth: { token } }), the same JWT as the API
+    try:
+        user_id = decode_token((auth or {}).get("token", ""))["sub"]
+    except Exception:
+        raise socketio.exceptions.ConnectionRefusedError("Invalid token")
+    await sio.enter_room(sid, _room(user_id))
+
+
+async def publish(
+    user_id: str,
+    resource: str,
+    action: str,
+    ids: Iterable[str],
+    application_id: str | None = None,
+) -> None:
+    """Emit a "change" event to every socket the user has open.
+
+    Call after the commit. Payloads only carry ids: clients refetch, which the
+    ETags make cheap. Delivery is best effort and never fails the request.
+    """
+    event = {"resource": resource, "action": action, "ids": list(ids)}
+    if application_id:
+        event["application_id"] = application_id
+    try:
+        await sio.emit("change", event, room=_room(user_id))
+    except Exception:
+        log.warning("could not publish %s %s for user %s", resource, action, user_id, exc_info=True)
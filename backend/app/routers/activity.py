@@ -0,0 +1,56 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+import base64
+import json
+from datetime import datetime
+from ..deps import get_db, get_current_user
+from ..http_cache import user_conditional
+from ..models import ApplicationEvent, User
+from ..schemas import ActivityPage
+
+router = APIRouter(prefix="/activity", tags=["activity"])
+
+
+def _encode_cursor(event: ApplicationEvent) -> str:
+    raw = json.dumps([event.occurred_at.isoformat(), event.id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        occurred_at, last_id = json.loads(raw)
+        return datetime.fromisoformat(occurred_at), last_id
+    except (ValueError, TypeError):
+        raise HTTPException(400, "Invalid cursor")
+
+
+@router.get("", response_model=ActivityPage)
+async def list_activity(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = None,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    # newest first, keyset-paginated on the (user_id, occurred_at, id) index
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
+    stmt = (
+        select(ApplicationEvent)
+        .where(ApplicationEvent.user_id == user.id)
+        .order_by(ApplicationEvent.occurred_at.desc(), ApplicationEvent.id.desc())
+    )
+    if cursor:
+        occurred_at, last_id = _decode_cursor(cursor)
+        stmt = stmt.where(
+            or_(
+                ApplicationEvent.occurred_at < occurred_at,
+                and_(ApplicationEvent.occurred_at == occurred_at, ApplicationEvent.id < last_id),
+            )
+        )
+    rows = (await db.scalars(stmt.limit(limit + 1))).all()
+    items = rows[:limit]
+    return {"items": items, "next_cursor": _encode_cursor(items[-1]) if len(rows) > limit else None}
@@ -1,48 +1,254 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, desc, asc
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter, ValidationError, create_model
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from sqlalchemy import desc, asc, delete, func, insert, select, tuple_, update
+import base64
+import json
 import uuid
+from collections import Counter, defaultdict
+from functools import lru_cache
+from operator import attrgetter
 from datetime import datetime
+from typing import Any, Literal, Sequence
 from ..deps import get_db, get_current_user
-from ..models import Application, Status, User
-from ..schemas import ApplicationIn, ApplicationOut, ApplicationQuery
+from ..http_cache import user_conditional
+from ..realtime import publish
+from ..models import (
+    Application,
+    ApplicationEvent,
+    Contact,
+    Document,
+    Note,
+    Reminder,
+    Stage,
+    Status,
+    Tag,
+    User,
+    application_tags,
+)
+from ..schemas import (
+    ApplicationEventOut,
+    ApplicationFull,
+    ApplicationIn,
+    ApplicationOut,
+    ApplicationPage,
+    ApplicationQuery,
+    ApplicationSearchHit,
+    ApplicationSummary,
+    BatchIn,
+    BatchItemResult,
+    BatchOut,
+    ImportResult,
+    ImportRowError,
+    TagModeLiteral,
+)
+from ..services.importer import iter_csv, iter_jsonl, iter_lines
+from ..services import stats, tags, timeline, versions, views
+from ..services.search import match_clause, search_applications
 
 
 router = APIRouter(prefix="/applications", tags=["applications"])
 
+# columns clients may sort by; each has a (user_id, <col>, id) index for keyset paging
+SORTABLE_FIELDS = ("last_update_at", "applied_at", "company", "role", "status", "location")
 
-def _apply_filters(qs, params: ApplicationQuery, user_id: str):
-    qs = qs.filter(Application.user_id == user_id)
+# bulk import: rows per executemany batch / per-row errors echoed back
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_REPORTED_ERRORS = 100
+
+# upper bound on application ids across all operations of one batch request
+BATCH_MAX_IDS = 1000
+
+# computed per page rather than read from an applications column
+INLINE_FIELDS = ("tag_ids",)
+
+# child collections GET /applications/{id}/full can embed, with the order each
+# list endpoint returns them in: (attribute, sort key, newest first)
+DETAIL_INCLUDES = {
+    "notes": ("created_at", True),
+    "stages": ("created_at", True),
+    "contacts": (None, False),
+    "reminders": ("due_at", False),
+    "documents": ("uploaded_at", True),
+    "tags": ("name", False),
+}
+
+
+def _apply_filters(db: AsyncSession, qs, params: ApplicationQuery, user_id: str):
+    qs = qs.where(Application.user_id == user_id)
     if params.status:
         try:
-            qs = qs.filter(Application.status == Status(params.status))
+            qs = qs.where(Application.status == Status(params.status))
         except ValueError:
             raise HTTPException(400, "Invalid status")
     if params.company:
-        qs = qs.filter(Application.company.ilike(f"%{params.company}%"))
+        qs = qs.where(Application.company.ilike(f"%{params.company}%"))
     if params.role:
-        qs = qs.filter(Application.role.ilike(f"%{params.role}%"))
+        qs = qs.where(Application.role.ilike(f"%{params.role}%"))
     if params.q:
-        like = f"%{params.q}%"
-        qs = qs.filter(
-            or_(
-                Application.company.ilike(like),
-                Application.role.ilike(like),
-                Application.jd_text.ilike(like),
+        qs = qs.where(match_clause(db, params.q))
+    if params.tags:
+        qs = qs.where(Application.id.in_(_tagged(params.tags, params.tag_mode)))
+    # sorting (id is always the tiebreaker so paging is deterministic)
+    field, descending = _sort_spec(params.sort)
+    col = getattr(Application, field)
+    direction = desc if descending else asc
+    order = direction(col)
+    if Application.__table__.c[field].nullable:
+        # NULLs last both ways; DESC NULLS LAST has its own index on Postgres
+        order = order.nulls_last()
+    qs = qs.order_by(order, direction(Application.id))
+    return qs
+
+
+def _tagged(tag_ids: list[str], mode: str):
+    # semi-join on the (tag_id, application_id) index; "all" keeps the
+    # applications linked to every requested tag
+    wanted = set(tag_ids)
+    links = select(application_tags.c.application_id).where(application_tags.c.tag_id.in_(wanted))
+    if mode == "all" and len(wanted) > 1:
+        links = links.group_by(application_tags.c.application_id).having(
+            func.count() == len(wanted)
+        )
+    return links
+
+
+async def _tag_ids(db: AsyncSession, app_ids: list[str]) -> dict[str, list[str]]:
+    # one query on the link table's primary key for the whole page, instead of
+    # a lazy load of Application.tags per row
+    by_app: dict[str, list[str]] = defaultdict(list)
+    if app_ids:
+        links = await db.execute(
+            select(application_tags.c.application_id, application_tags.c.tag_id).where(
+                application_tags.c.application_id.in_(app_ids)
             )
         )
-    # sorting
-    sort = params.sort or "-last_update_at"
-    direction = desc if sort.startswith("-") else asc
-    field = sort[1:] if sort.startswith("-") else sort
-    if not hasattr(Application, field):
+        for app_id, tag_id in links:
+            by_app[app_id].append(tag_id)
+    return by_app
+
+
+def _parse_fields(fields: str) -> tuple[str, ...]:
+    # "summary" is shorthand for ApplicationSummary; id is always returned
+    if fields.strip() == "summary":
+        names = list(ApplicationSummary.model_fields)
+    else:
+        names = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = set(names) - ApplicationOut.model_fields.keys()
+    if unknown:
+        raise HTTPException(400, f"Unknown fields: {', '.join(sorted(unknown))}")
+    return tuple(dict.fromkeys(["id", *names]))
+
+
+@lru_cache(maxsize=64)
+def _sparse_adapters(fields: tuple[str, ...]) -> tuple[TypeAdapter, TypeAdapter]:
+    # (list adapter, keyset-page adapter) for a projection, built once per field set
+    model: type[BaseModel]
+    if set(fields) == ApplicationSummary.model_fields.keys():
+        model = ApplicationSummary
+    else:
+        definitions: dict[str, Any] = {
+            f: (ApplicationOut.model_fields[f].annotation, ApplicationOut.model_fields[f])
+            for f in fields
+        }
+        model = create_model(
+            "ApplicationFields", __config__=ConfigDict(from_attributes=True), **definitions
+        )
+    # model is only known at runtime, which mypy cannot follow into list[...]
+    page = create_model(
+        "ApplicationFieldsPage",
+        items=(list[model], ...),  # type: ignore[valid-type]
+        next_cursor=(str | None, None),
+    )
+    return TypeAdapter(list[model]), TypeAdapter(page)  # type: ignore[valid-type]
+
+
+def _sort_spec(sort: str | None) -> tuple[str, bool]:
+    sort = sort or "-last_update_at"
+    descending = sort.startswith("-")
+    field = sort.lstrip("-")
+    if field not in SORTABLE_FIELDS:
         field = "last_update_at"
-    qs = qs.order_by(direction(getattr(Application, field)))
-    return qs
+    return field, descending
+
+
+def _encode_cursor(field: str, descending: bool, app) -> str:
+    value = getattr(app, field)
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, Status):
+        value = value.value
+    raw = json.dumps([("-" if descending else "") + field, value, app.id])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, field: str, descending: bool):
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        sort, value, last_id = json.loads(raw)
+    except (ValueError, TypeError):
+        raise HTTPException(400, "Invalid cursor")
+    if sort != ("-" if descending else "") + field:
+        raise HTTPException(400, "Cursor does not match sort order")
+    try:
+        if value is not None and field in ("applied_at", "last_update_at"):
+            value = datetime.fromisoformat(value)
+        elif value is not None and field == "status":
+            value = Status(value)
+    except (ValueError, TypeError):
+        raise HTTPException(400, "Invalid cursor")
+    return value, last_id
+
+
+def _keyset_segments(qs, field: str, descending: bool, cursor: str):
+    """Statements that, run in order, list the rows after `cursor`.
 
+    The listing is "field dir NULLS LAST, id dir". An OR across the NULL
+    boundary would not be sargable, so the non-NULL part is a row-comparison
+    seek in the column's natural order and the NULL tail a separate query,
+    both range scans of the (user_id, field, id) index.
+    """
+    col = getattr(Application, field)
+    direction = desc if descending else asc
+    qs = qs.order_by(None)
+    value, last_id = _decode_cursor(cursor, field, descending) if cursor else (None, None)
+    null_tail = qs.where(col.is_(None)).order_by(direction(Application.id))
+    if last_id is not None and value is None:
+        # already in the NULL tail
+        id_after = Application.id < last_id if descending else Application.id > last_id
+        return [null_tail.where(id_after)]
+    present = qs.order_by(direction(col), direction(Application.id))
+    if last_id is not None:
+        key = tuple_(col, Application.id)
+        present = present.where(key < (value, last_id) if descending else key > (value, last_id))
+    if not Application.__table__.c[field].nullable:
+        return [present]
+    return [present.where(col.is_not(None)), null_tail]
 
-@router.get("", response_model=list[ApplicationOut])
-def list_apps(
+
+def _new_app_values(body: ApplicationIn, user_id: str) -> dict:
+    return dict(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
+        company=body.company,
+        role=body.role,
+        location=body.location,
+        source=body.source,
+        salary_min=body.salary_min,
+        salary_max=body.salary_max,
+        status=Status(body.status),
+        job_url=str(body.job_url) if body.job_url else None,
+        jd_text=body.jd_text,
+        applied_at=body.applied_at,
+        last_update_at=datetime.utcnow(),
+    )
+
+
+@router.get("", response_model=list[ApplicationOut] | ApplicationPage)
+async def list_apps(
+    request: Request,
+    response: Response,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     status: str | None = None,
@@ -50,9 +256,17 @@ def list_apps(
     role: str | None = None,
     q: str | None = None,
     sort: str | None = None,
-    db: Session = Depends(get_db),
+    cursor: str | None = None,
+    fields: str | None = Query(
+        None, description='comma-separated field names, or "summary" for list views'
+    ),
+    tags: str | None = Query(None, description="comma-separated tag ids"),
+    tag_mode: TagModeLiteral = "any",
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
     params = ApplicationQuery(
         page=page,
         page_size=page_size,
@@ -61,61 +275,240 @@ def list_apps(
         role=role,
         q=q,
         sort=sort,
+        tags=[t.strip() for t in tags.split(",") if t.strip()] if tags else None,
+        tag_mode=tag_mode,
     )
-    base = _apply_filters(db.query(Application), params, user.id)
-    return base.offset((params.page - 1) * params.page_size).limit(params.page_size).all()
+    field, descending = _sort_spec(params.sort)
+    if fields is None:
+        base = select(Application)
+    else:
+        # sparse fieldset: select only those columns (plus the sort key for the
+        # cursor) as plain rows, so jd_text is never read and no ORM objects are built
+        names = _parse_fields(fields)
+        columns = [f for f in dict.fromkeys([*names, field]) if f not in INLINE_FIELDS]
+        base = select(*(getattr(Application, f) for f in columns))
+    base = _apply_filters(db, base, params, user.id)
+
+    if cursor is None:
+        stmts = [base.offset((params.page - 1) * params.page_size)]
+    else:
+        # keyset mode: pass an empty cursor for the first page, then next_cursor
+        stmts = _keyset_segments(base, field, descending, cursor)
+    # one extra row tells keyset mode whether there is a next page
+    wanted = params.page_size if cursor is None else params.page_size + 1
+    rows: list = []
+    for stmt in stmts:
+        if len(rows) >= wanted:
+            break
+        stmt = stmt.limit(wanted - len(rows))
+        if fields is None:
+            rows += (await db.scalars(stmt)).all()
+        else:
+            rows += (await db.execute(stmt)).all()
+    items: Sequence = rows[: params.page_size]
+    next_cursor = None
+    if cursor is not None and len(rows) > params.page_size:
+        next_cursor = _encode_cursor(field, descending, items[-1])
+
+    if fields is None:
+        tag_ids = await _tag_ids(db, [app.id for app in items])
+        for app in items:
+            app.tag_ids = tag_ids[app.id]
+    elif "tag_ids" in names:
+        tag_ids = await _tag_ids(db, [row.id for row in items])
+        items = [{**row._asdict(), "tag_ids": tag_ids[row.id]} for row in items]
+    result = items if cursor is None else {"items": items, "next_cursor": next_cursor}
+    if fields is None:
+        return result
+
+    # serialize straight to JSON with the projection's own schema, bypassing
+    # response_model (which would demand every ApplicationOut field)
+    as_list, as_page = _sparse_adapters(names)
+    adapter = as_list if cursor is None else as_page
+    body = adapter.dump_json(adapter.validate_python(result, from_attributes=True))
+    return Response(body, media_type="application/json", headers=dict(response.headers))
+
+
+@router.get("/search", response_model=list[ApplicationSearchHit])
+async def search_apps(
+    q: str,
+    request: Request,
+    response: Response,
+    limit: int = 20,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
+    hits = await search_applications(db, user.id, q, limit=min(max(limit, 1), 100))
+    return [
+        ApplicationSearchHit.model_validate(app).model_copy(
+            update={"rank": rank, "snippet": snippet}
+        )
+        for app, rank, snippet in hits
+    ]
 
 
 @router.get("/{app_id}", response_model=ApplicationOut)
-def get_app(app_id: str, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    app = (
-        db.query(Application)
-        .filter(Application.id == app_id, Application.user_id == user.id)
-        .first()
+async def get_app(
+    app_id: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
+    app = await db.scalar(
+        select(Application).where(Application.id == app_id, Application.user_id == user.id)
     )
     if not app:
         raise HTTPException(404, "Not found")
     return app
 
 
+@router.get("/{app_id}/full", response_model=ApplicationFull, response_model_exclude_unset=True)
+async def get_app_full(
+    app_id: str,
+    request: Request,
+    response: Response,
+    include: str | None = Query(None, description="comma-separated, e.g. notes,stages"),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
+    # one query for the application plus one selectin query per included collection
+    names = [n.strip() for n in include.split(",") if n.strip()] if include else DETAIL_INCLUDES
+    unknown = set(names) - DETAIL_INCLUDES.keys()
+    if unknown:
+        raise HTTPException(400, f"Unknown include: {', '.join(sorted(unknown))}")
+    app = await db.scalar(
+        select(Application)
+        .options(*(selectinload(getattr(Application, n)) for n in names))
+        .where(Application.id == app_id, Application.user_id == user.id)
+    )
+    if not app:
+        raise HTTPException(404, "Not found")
+    data = {f: getattr(app, f, None) for f in ApplicationOut.model_fields}
+    for n in names:
+        key, newest_first = DETAIL_INCLUDES[n]
+        items = getattr(app, n)
+        data[n] = sorted(items, key=attrgetter(key), reverse=newest_first) if key else items
+    return ApplicationFull.model_validate(data, from_attributes=True)
+
+
+@router.get("/{app_id}/timeline", response_model=list[ApplicationEventOut])
+async def get_timeline(
+    app_id: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    # served from the append-only event log alone, so it also works after a delete
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
+    events = (
+        await db.scalars(
+            select(ApplicationEvent)
+            .where(ApplicationEvent.application_id == app_id, ApplicationEvent.user_id == user.id)
+            .order_by(ApplicationEvent.occurred_at, ApplicationEvent.id)
+        )
+    ).all()
+    if not events:
+        raise HTTPException(404, "Not found")
+    return events
+
+
 @router.post("", response_model=ApplicationOut)
-def create_app(
+async def create_app(
     body: ApplicationIn,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    app = Application(
-        id=str(uuid.uuid4()),
-        user_id=user.id,
-        company=body.company,
-        role=body.role,
-        location=body.location,
-        source=body.source,
-        salary_min=body.salary_min,
-        salary_max=body.salary_max,
-        status=Status(body.status),
-        job_url=str(body.job_url) if body.job_url else None,
-        jd_text=body.jd_text,
-        applied_at=body.applied_at,
-        last_update_at=datetime.utcnow(),
-    )
+    app = Application(**_new_app_values(body, user.id))
     db.add(app)
-    db.commit()
-    db.refresh(app)
+    await stats.bump(db, user.id, stats.app_deltas(app.status, app.applied_at))
+    await timeline.record(
+        db, timeline.event(user.id, app.id, timeline.CREATED, to_status=app.status)
+    )
+    await versions.touch(db, user.id)
+    await db.commit()
+    views.invalidate(user.id)
+    await db.refresh(app)
+    await publish(user.id, "application", "created", [app.id])
     return app
 
 
+@router.post("/import", response_model=ImportResult)
+async def import_apps(
+    request: Request,
+    format: Literal["csv", "jsonl"] | None = None,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    # body is read as a stream; rows are validated one by one and inserted in
+    # executemany batches, so memory is bounded by IMPORT_BATCH_SIZE
+    fmt = format or ("csv" if "csv" in request.headers.get("content-type", "") else "jsonl")
+    parse = iter_csv if fmt == "csv" else iter_jsonl
+    result = ImportResult()
+    batch: list[dict] = []
+
+    async def flush():
+        if batch:
+            await db.execute(insert(Application), batch)
+            deltas: Counter = Counter()
+            for row in batch:
+                deltas.update(stats.app_deltas(row["status"], row["applied_at"]))
+            await stats.bump(db, user.id, deltas)
+            await timeline.record(
+                db,
+                *(
+                    timeline.event(user.id, row["id"], timeline.CREATED, to_status=row["status"])
+                    for row in batch
+                ),
+            )
+            await versions.touch(db, user.id)
+            await db.commit()
+            views.invalidate(user.id)
+            await publish(user.id, "application", "created", [row["id"] for row in batch])
+            result.inserted += len(batch)
+            batch.clear()
+
+    async for lineno, record in parse(iter_lines(request.stream())):
+        try:
+            if isinstance(record, str):
+                raise ValueError(record)
+            batch.append(_new_app_values(ApplicationIn.model_validate(record), user.id))
+        except (ValueError, ValidationError) as e:
+            result.failed += 1
+            if len(result.errors) < IMPORT_MAX_REPORTED_ERRORS:
+                result.errors.append(ImportRowError(line=lineno, error=_import_error(e)))
+            continue
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            await flush()
+    await flush()
+    return result
+
+
+def _import_error(e: Exception) -> str:
+    if isinstance(e, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(p) for p in err['loc']) or 'row'}: {err['msg']}" for err in e.errors()
+        )
+    return str(e)
+
+
 @router.patch("/{app_id}", response_model=ApplicationOut)
-def update_app(
+async def update_app(
     app_id: str,
     body: ApplicationIn,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    app = (
-        db.query(Application)
-        .filter(Application.id == app_id, Application.user_id == user.id)
-        .first()
+    app = await db.scalar(
+        select(Application).where(Application.id == app_id, Application.user_id == user.id)
     )
     if not app:
         raise HTTPException(404, "Not found")
@@ -124,48 +517,173 @@ def update_app(
         data["status"] = Status(data["status"])
     if "job_url" in data and data["job_url"] is not None:
         data["job_url"] = str(data["job_url"])
+    deltas = stats.app_deltas(app.status, app.applied_at, -1)
+    old_status = app.status
+    changed = sorted(k for k, v in data.items() if getattr(app, k) != v)
     for k, v in data.items():
         setattr(app, k, v)
     app.last_update_at = datetime.utcnow()
-    db.commit()
-    db.refresh(app)
+    deltas.update(stats.app_deltas(app.status, app.applied_at))
+    await stats.bump(db, user.id, deltas)
+    if changed:
+        kind = timeline.STATUS_CHANGED if "status" in changed else timeline.UPDATED
+        await timeline.record(
+            db,
+            timeline.event(
+                user.id,
+                app.id,
+                kind,
+                from_status=old_status,
+                to_status=app.status,
+                data={"fields": changed},
+                occurred_at=app.last_update_at,
+            ),
+        )
+    await versions.touch(db, user.id)
+    await db.commit()
+    views.invalidate(user.id)
+    await db.refresh(app)
+    await publish(user.id, "application", "updated", [app.id])
     return app
 
 
 @router.delete("/{app_id}")
-def delete_app(app_id: str, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    app = (
-        db.query(Application)
-        .filter(Application.id == app_id, Application.user_id == user.id)
-        .first()
+async def delete_app(
+    app_id: str, db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)
+):
+    app = await db.scalar(
+        select(Application).where(Application.id == app_id, Application.user_id == user.id)
     )
     if not app:
         raise HTTPException(404, "Not found")
-    db.delete(app)
-    db.commit()
+    deltas = stats.app_deltas(app.status, app.applied_at, -1)
+    deltas.subtract(await stats.stage_types(db, [app.id]))
+    await db.delete(app)
+    await stats.bump(db, user.id, deltas)
+    await timeline.record(
+        db, timeline.event(user.id, app.id, timeline.DELETED, from_status=app.status)
+    )
+    await versions.touch(db, user.id)
+    await db.commit()
+    views.invalidate(user.id)
+    await publish(user.id, "application", "deleted", [app_id])
     return {"ok": True}
 
 
-@router.get("/search", response_model=list[ApplicationOut])
-def search_apps(
-    q: str,
-    limit: int = 20,
-    db: Session = Depends(get_db),
+@router.post("/batch", response_model=BatchOut)
+async def batch_apps(
+    body: BatchIn,
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    like = f"%{q}%"
-    qs = (
-        db.query(Application)
-        .filter(Application.user_id == user.id)
-        .filter(
-            or_(
-                Application.company.ilike(like),
-                Application.role.ilike(like),
-                Application.location.ilike(like),
-                Application.jd_text.ilike(like),
+    # every operation is a handful of set-based statements; all of them
+    # commit together or not at all
+    if sum(len(op.ids) for op in body.operations) > BATCH_MAX_IDS:
+        raise HTTPException(400, f"At most {BATCH_MAX_IDS} ids per batch")
+    results: list[BatchItemResult] = []
+    deltas: Counter = Counter()
+    changed: list[tuple[str, list[str]]] = []  # (action, ids) to publish after commit
+    events: list[dict] = []
+    for i, op in enumerate(body.operations):
+        rows = (
+            await db.execute(
+                select(Application.id, Application.status, Application.applied_at).where(
+                    Application.id.in_(op.ids), Application.user_id == user.id
+                )
             )
-        )
-        .order_by(desc(Application.last_update_at))
-        .limit(min(max(limit, 1), 100))
-    )
-    return qs.all()
+        ).all()
+        owned = {r.id: r for r in rows}
+        ids = list(owned)
+        error = None
+        if op.op == "set_status":
+            if op.status is None:
+                error = "status is required"
+            elif ids:
+                new_status = Status(op.status)
+                await db.execute(
+                    update(Application)
+                    .where(Application.id.in_(ids))
+                    .values(status=new_status, last_update_at=datetime.utcnow())
+                )
+                for r in rows:
+                    deltas[(stats.STATUS, r.status.value)] -= 1
+                    deltas[(stats.STATUS, new_status.value)] += 1
+                    if r.status != new_status:
+                        events.append(
+                            timeline.event(
+                                user.id,
+                                r.id,
+                                timeline.STATUS_CHANGED,
+                                from_status=r.status,
+                                to_status=new_status,
+                                data={"fields": ["status"]},
+                            )
+                        )
+        elif op.op == "delete":
+            if ids:
+                for r in rows:
+                    deltas.update(stats.app_deltas(r.status, r.applied_at, -1))
+                    events.append(
+                        timeline.event(user.id, r.id, timeline.DELETED, from_status=r.status)
+                    )
+                deltas.subtract(await stats.stage_types(db, ids))
+                await _delete_apps(db, ids)
+        elif not op.tag_ids:
+            error = "tag_ids is required"
+        else:
+            tag_ids = (
+                await db.scalars(
+                    select(Tag.id).where(Tag.id.in_(op.tag_ids), Tag.user_id == user.id)
+                )
+            ).all()
+            if len(tag_ids) != len(set(op.tag_ids)):
+                error = "Tag not found"
+            elif ids and op.op == "add_tags":
+                linked = await db.execute(
+                    select(application_tags).where(
+                        application_tags.c.application_id.in_(ids),
+                        application_tags.c.tag_id.in_(tag_ids),
+                    )
+                )
+                existing = {(r.application_id, r.tag_id) for r in linked}
+                links = [
+                    {"application_id": a, "tag_id": t}
+                    for a in ids
+                    for t in tag_ids
+                    if (a, t) not in existing
+                ]
+                if links:
+                    await db.execute(insert(application_tags), links)
+            elif ids:
+                await db.execute(
+                    delete(application_tags).where(
+                        application_tags.c.application_id.in_(ids),
+                        application_tags.c.tag_id.in_(tag_ids),
+                    )
+                )
+        if ids and not error:
+            changed.append(("deleted" if op.op == "delete" else "updated", ids))
+        for app_id in op.ids:
+            if error:
+                results.append(BatchItemResult(op_index=i, id=app_id, ok=False, error=error))
+            elif app_id not in owned:
+                results.append(BatchItemResult(op_index=i, id=app_id, ok=False, error="Not found"))
+            else:
+                results.append(BatchItemResult(op_index=i, id=app_id, ok=True))
+    await stats.bump(db, user.id, deltas)
+    await timeline.record(db, *events)
+    await versions.touch(db, user.id)
+    await db.commit()
+    views.invalidate(user.id)
+    tags.invalidate(user.id)
+    for action, ids in changed:
+        await publish(user.id, "application", action, ids)
+    return BatchOut(results=results)
+
+
+async def _delete_apps(db: AsyncSession, ids: list[str]) -> None:
+    # bulk deletes skip ORM cascades, so clear child rows explicitly
+    for child in (Note, Stage, Contact, Reminder, Document):
+        await db.execute(delete(child).where(child.application_id.in_(ids)))
+    await db.execute(delete(application_tags).where(application_tags.c.application_id.in_(ids)))
+    await db.execute(delete(Application).where(Application.id.in_(ids)))
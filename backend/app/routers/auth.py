@@ -1,41 +1,70 @@
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 from ..schemas import UserCreate, TokenOut
 from ..models import User
-from ..security import hash_password, verify_password, create_token
+from ..security import (
+    HashingBusy,
+    create_token,
+    hash_password_async,
+    verify_and_update_async,
+)
 from ..deps import get_db
 from ..deps import get_current_user
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
+# seconds clients are told to wait when the hashing pool is saturated
+HASHING_RETRY_AFTER = 1
+
+
+def _busy() -> HTTPException:
+    return HTTPException(
+        429, "Too many authentication requests", headers={"Retry-After": str(HASHING_RETRY_AFTER)}
+    )
+
 
 @router.post("/register", response_model=TokenOut)
-def register(data: UserCreate, db: Session = Depends(get_db)):
-    if db.query(User).filter(User.email == data.email).first():
+async def register(data: UserCreate, db: AsyncSession = Depends(get_db)):
+    if await db.scalar(select(User).where(User.email == data.email)):
         raise HTTPException(400, "Email already registered")
+    try:
+        password_hash = await hash_password_async(data.password)
+    except HashingBusy:
+        raise _busy()
     user = User(
         id=str(uuid.uuid4()),
         email=data.email,
         name=data.name,
-        password_hash=hash_password(data.password),
+        password_hash=password_hash,
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
-    tok = create_token(user.id)
+    await db.commit()
+    await db.refresh(user)
+    tok = create_token(user.id, email=user.email, name=user.name)
     return {"access_token": tok, "user": user}
 
 
 @router.post("/login", response_model=TokenOut)
-def login(data: UserCreate, db: Session = Depends(get_db)):
-    user = db.query(User).filter(User.email == data.email).first()
-    if not user or not verify_password(data.password, user.password_hash):
+async def login(data: UserCreate, db: AsyncSession = Depends(get_db)):
+    user = await db.scalar(select(User).where(User.email == data.email))
+    if not user:
+        raise HTTPException(400, "Invalid credentials")
+    try:
+        ok, new_hash = await verify_and_update_async(data.password, user.password_hash)
+    except HashingBusy:
+        raise _busy()
+    if not ok:
         raise HTTPException(400, "Invalid credentials")
-    tok = create_token(user.id)
+    if new_hash:
+        # hash was made with old cost settings; upgrade it transparently
+        user.password_hash = new_hash
+        await db.commit()
+    tok = create_token(user.id, email=user.email, name=user.name)
     return {"access_token": tok, "user": user}
 
 
 @router.get("/test-token")
-def test_token(user: User = Depends(get_current_user)):
+async def test_token(user: User = Depends(get_current_user)):
     return {"ok": True, "user": {"id": user.id, "email": user.email, "name": user.name}}
@@ -1,39 +1,44 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 from ..deps import get_db, get_current_user
+from ..http_cache import user_conditional
 from ..models import Application, Contact, User
 from ..schemas import ContactIn, ContactOut
+from ..services import versions
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
 
 @router.get("/{application_id}", response_model=list[ContactOut])
-def list_contacts(
+async def list_contacts(
     application_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    app = (
-        db.query(Application)
-        .filter(Application.id == application_id, Application.user_id == user.id)
-        .first()
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
+    app = await db.scalar(
+        select(Application).where(Application.id == application_id, Application.user_id == user.id)
     )
     if not app:
         raise HTTPException(404, "Application not found")
-    return db.query(Contact).filter(Contact.application_id == application_id).all()
+    return (await db.scalars(select(Contact).where(Contact.application_id == application_id))).all()
 
 
 @router.post("", response_model=ContactOut)
-def create_contact(
+async def create_contact(
     body: ContactIn,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    app = (
-        db.query(Application)
-        .filter(Application.id == body.application_id, Application.user_id == user.id)
-        .first()
+    app = await db.scalar(
+        select(Application).where(
+            Application.id == body.application_id, Application.user_id == user.id
+        )
     )
     if not app:
         raise HTTPException(404, "Application not found")
@@ -46,25 +51,26 @@ def create_contact(
         notes=body.notes,
     )
     db.add(c)
-    db.commit()
-    db.refresh(c)
+    await versions.touch(db, user.id)
+    await db.commit()
+    await db.refresh(c)
     return c
 
 
 @router.delete("/{contact_id}")
-def delete_contact(
+async def delete_contact(
     contact_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    c = (
-        db.query(Contact)
+    c = await db.scalar(
+        select(Contact)
         .join(Application, Contact.application_id == Application.id)
-        .filter(Contact.id == contact_id, Application.user_id == user.id)
-        .first()
+        .where(Contact.id == contact_id, Application.user_id == user.id)
     )
     if not c:
         raise HTTPException(404, "Not found")
-    db.delete(c)
-    db.commit()
+    await db.delete(c)
+    await versions.touch(db, user.id)
+    await db.commit()
     return {"ok": True}
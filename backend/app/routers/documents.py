@@ -1,21 +1,31 @@
 # app/routers/documents.py
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime
 
 from ..deps import get_db, get_current_user
+from ..http_cache import user_conditional
 from ..models import Document, Application, User
-from ..schemas import PresignIn, DocumentOut, DocumentCreate
-from ..services.s3 import presign_put, presign_get
+from ..config import settings
+from ..schemas import (
+    DocumentCreate,
+    DocumentOut,
+    DownloadBatchIn,
+    DownloadBatchOut,
+    PresignBatchIn,
+    PresignBatchOut,
+    PresignIn,
+)
+from ..services import versions
+from ..services.s3 import presign_get_batch, presign_put_batch
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
 
-def _ensure_app(db: Session, app_id: str, user_id: str) -> Application:
-    app = (
-        db.query(Application)
-        .filter(Application.id == app_id, Application.user_id == user_id)
-        .first()
+async def _ensure_app(db: AsyncSession, app_id: str, user_id: str) -> Application:
+    app = await db.scalar(
+        select(Application).where(Application.id == app_id, Application.user_id == user_id)
     )
     if not app:
         raise HTTPException(404, "Application not found")
@@ -23,42 +33,61 @@ def _ensure_app(db: Session, app_id: str, user_id: str) -> Application:
 
 
 @router.get("/{application_id}", response_model=list[DocumentOut])
-def list_documents(
+async def list_documents(
     application_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    _ensure_app(db, application_id, user.id)
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
+    await _ensure_app(db, application_id, user.id)
     docs = (
-        db.query(Document)
-        .filter(Document.application_id == application_id)
-        .order_by(Document.uploaded_at.desc())
-        .all()
-    )
+        await db.scalars(
+            select(Document)
+            .where(Document.application_id == application_id)
+            .order_by(Document.uploaded_at.desc())
+        )
+    ).all()
     return docs
 
 
 @router.post("/{application_id}/presign")
-def presign_upload(
+async def presign_upload(
     application_id: str,
     body: PresignIn,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    _ensure_app(db, application_id, user.id)
+    await _ensure_app(db, application_id, user.id)
     # return a PUT URL and key for direct upload to S3
-    url, key = presign_put(body.file_name, body.content_type)
+    [(url, key)] = await presign_put_batch([(body.file_name, body.content_type)])
     return {"upload_url": url, "s3_key": key}
 
 
+@router.post("/{application_id}/presign-batch", response_model=PresignBatchOut)
+async def presign_upload_batch(
+    application_id: str,
+    body: PresignBatchIn,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    if len(body.files) > settings.PRESIGN_BATCH_MAX:
+        raise HTTPException(400, f"At most {settings.PRESIGN_BATCH_MAX} files per request")
+    await _ensure_app(db, application_id, user.id)
+    signed = await presign_put_batch([(f.file_name, f.content_type) for f in body.files])
+    return {"uploads": [{"upload_url": url, "s3_key": key} for url, key in signed]}
+
+
 @router.post("", response_model=DocumentOut)
-def register_document(
+async def register_document(
     body: DocumentCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     # safety: ensure user owns the application
-    _ensure_app(db, body.application_id, user.id)
+    await _ensure_app(db, body.application_id, user.id)
     doc = Document(
         id=body.id,  # allow client to pass id or generate below
         application_id=body.application_id,
@@ -73,37 +102,64 @@ def register_document(
 
         doc.id = str(uuid.uuid4())
     db.add(doc)
-    db.commit()
-    db.refresh(doc)
+    await versions.touch(db, user.id)
+    await db.commit()
+    await db.refresh(doc)
     return doc
 
 
 @router.get("/download/{document_id}")
-def get_download_url(
+async def get_download_url(
     document_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    doc = db.query(Document).filter(Document.id == document_id).first()
+    doc = await db.get(Document, document_id)
     if not doc:
         raise HTTPException(404, "Not found")
     # security: ensure user owns the application
-    _ensure_app(db, doc.application_id, user.id)
-    url = presign_get(doc.s3_key)
+    await _ensure_app(db, doc.application_id, user.id)
+    [url] = await presign_get_batch([doc.s3_key])
     return {"url": url}
 
 
+@router.post("/download-batch", response_model=DownloadBatchOut)
+async def get_download_urls(
+    body: DownloadBatchIn,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    if len(body.document_ids) > settings.PRESIGN_BATCH_MAX:
+        raise HTTPException(400, f"At most {settings.PRESIGN_BATCH_MAX} documents per request")
+    # one ownership query for the whole batch
+    rows = (
+        await db.execute(
+            select(Document.id, Document.s3_key)
+            .join(Application, Document.application_id == Application.id)
+            .where(Document.id.in_(body.document_ids), Application.user_id == user.id)
+        )
+    ).all()
+    keys = {r.id: r.s3_key for r in rows}
+    found = [i for i in dict.fromkeys(body.document_ids) if i in keys]
+    urls = await presign_get_batch([keys[i] for i in found])
+    return {
+        "urls": [{"id": i, "url": url} for i, url in zip(found, urls)],
+        "missing": [i for i in dict.fromkeys(body.document_ids) if i not in keys],
+    }
+
+
 @router.delete("/{document_id}")
-def delete_document(
+async def delete_document(
     document_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    doc = db.query(Document).filter(Document.id == document_id).first()
+    doc = await db.get(Document, document_id)
     if not doc:
         raise HTTPException(404, "Not found")
-    _ensure_app(db, doc.application_id, user.id)
-    db.delete(doc)
-    db.commit()
+    await _ensure_app(db, doc.application_id, user.id)
+    await db.delete(doc)
+    await versions.touch(db, user.id)
+    await db.commit()
     # (Optional) delete from S3 here as well if you want: s3.delete_object(Bucket=..., Key=doc.s3_key)
     return {"ok": True}
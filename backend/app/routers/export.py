@@ -0,0 +1,140 @@
+# app/routers/export.py
+import csv
+import enum
+import io
+import json
+from datetime import datetime
+from typing import Literal
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from sqlalchemy import inspect, select
+
+from ..db import AsyncSessionLocal
+from ..deps import get_current_user
+from ..models import (
+    Application,
+    Contact,
+    Document,
+    Note,
+    Reminder,
+    Stage,
+    Tag,
+    User,
+    application_tags,
+)
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+# rows fetched per round trip from the server-side cursor
+EXPORT_BATCH_SIZE = 500
+
+Resource = Literal["applications", "notes", "stages", "contacts", "reminders", "documents", "tags"]
+RESOURCES: tuple[Resource, ...] = (
+    "applications",
+    "notes",
+    "stages",
+    "contacts",
+    "reminders",
+    "documents",
+    "tags",
+)
+_CHILD_MODELS: dict[
+    str, type[Note] | type[Stage] | type[Contact] | type[Reminder] | type[Document]
+] = {
+    "notes": Note,
+    "stages": Stage,
+    "contacts": Contact,
+    "reminders": Reminder,
+    "documents": Document,
+}
+
+
+def _query(resource: str, user_id: str):
+    if resource == "applications":
+        return select(Application).where(Application.user_id == user_id).order_by(Application.id)
+    if resource == "tags":
+        return (
+            select(application_tags.c.application_id, Tag.id.label("tag_id"), Tag.name)
+            .join(Tag, Tag.id == application_tags.c.tag_id)
+            .join(Application, Application.id == application_tags.c.application_id)
+            .where(Application.user_id == user_id)
+            .order_by(application_tags.c.application_id, Tag.name)
+        )
+    model = _CHILD_MODELS[resource]
+    return (
+        select(model)
+        .join(Application, model.application_id == Application.id)
+        .where(Application.user_id == user_id)
+        .order_by(model.id)
+    )
+
+
+def _to_dict(obj) -> dict:
+    # plain column values only: no relationship loads while streaming
+    if hasattr(obj, "_mapping"):
+        return dict(obj._mapping)
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
+
+
+def _plain(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+
+async def _rows(resource: str, user_id: str):
+    # own session: the request-scoped one from get_db is closed before the
+    # response body is streamed
+    async with AsyncSessionLocal() as db:
+        stmt = _query(resource, user_id).execution_options(yield_per=EXPORT_BATCH_SIZE)
+        result = await (db.stream(stmt) if resource == "tags" else db.stream_scalars(stmt))
+        async for obj in result:
+            yield {k: _plain(v) for k, v in _to_dict(obj).items()}
+
+
+async def _ndjson(resources: tuple[str, ...], user_id: str):
+    for resource in resources:
+        async for row in _rows(resource, user_id):
+            yield json.dumps({"resource": resource, **row}) + "\n"
+
+
+async def _csv(resource: str, user_id: str):
+    buf = io.StringIO()
+    writer = None
+    async for row in _rows(resource, user_id):
+        if writer is None:
+            writer = csv.DictWriter(buf, fieldnames=list(row))
+            writer.writeheader()
+        writer.writerow(row)
+        if buf.tell() > 64 * 1024:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate()
+    if buf.tell():
+        yield buf.getvalue()
+
+
+@router.get("")
+async def export_data(
+    format: Literal["ndjson", "csv"] = "ndjson",
+    resource: Resource | None = None,
+    user: User = Depends(get_current_user),
+):
+    """Stream the user's data. NDJSON mixes every resource (each line has a
+    "resource" key); CSV holds one resource per download (default: applications)."""
+    stamp = datetime.utcnow().strftime("%Y%m%d")
+    if format == "csv":
+        name = resource or "applications"
+        return StreamingResponse(
+            _csv(name, user.id),
+            media_type="text/csv",
+            headers={"Content-Disposition": f'attachment; filename="{name}-{stamp}.csv"'},
+        )
+    return StreamingResponse(
+        _ndjson((resource,) if resource else RESOURCES, user.id),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="export-{stamp}.ndjson"'},
+    )
@@ -1,42 +1,49 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 from ..deps import get_db, get_current_user
+from ..http_cache import user_conditional
+from ..realtime import publish
 from ..models import Application, Note, User
 from ..schemas import NoteIn, NoteOut
+from ..services import versions
 
 router = APIRouter(prefix="/notes", tags=["notes"])
 
 
 @router.get("/{application_id}", response_model=list[NoteOut])
-def list_notes(
+async def list_notes(
     application_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    app = (
-        db.query(Application)
-        .filter(Application.id == application_id, Application.user_id == user.id)
-        .first()
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
+    app = await db.scalar(
+        select(Application).where(Application.id == application_id, Application.user_id == user.id)
     )
     if not app:
         raise HTTPException(404, "Application not found")
     return (
-        db.query(Note)
-        .filter(Note.application_id == application_id)
-        .order_by(Note.created_at.desc())
-        .all()
-    )
+        await db.scalars(
+            select(Note)
+            .where(Note.application_id == application_id)
+            .order_by(Note.created_at.desc())
+        )
+    ).all()
 
 
 @router.post("", response_model=NoteOut)
-def create_note(
-    body: NoteIn, db: Session = Depends(get_db), user: User = Depends(get_current_user)
+async def create_note(
+    body: NoteIn, db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)
 ):
-    app = (
-        db.query(Application)
-        .filter(Application.id == body.application_id, Application.user_id == user.id)
-        .first()
+    app = await db.scalar(
+        select(Application).where(
+            Application.id == body.application_id, Application.user_id == user.id
+        )
     )
     if not app:
         raise HTTPException(404, "Application not found")
@@ -47,23 +54,26 @@ def create_note(
         content=body.content,
     )
     db.add(n)
-    db.commit()
-    db.refresh(n)
+    await versions.touch(db, user.id)
+    await db.commit()
+    await db.refresh(n)
+    await publish(user.id, "note", "created", [n.id], n.application_id)
     return n
 
 
 @router.delete("/{note_id}")
-def delete_note(
-    note_id: str, db: Session = Depends(get_db), user: User = Depends(get_current_user)
+async def delete_note(
+    note_id: str, db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)
 ):
-    n = (
-        db.query(Note)
+    n = await db.scalar(
+        select(Note)
         .join(Application, Note.application_id == Application.id)
-        .filter(Note.id == note_id, Application.user_id == user.id)
-        .first()
+        .where(Note.id == note_id, Application.user_id == user.id)
     )
     if not n:
         raise HTTPException(404, "Not found")
-    db.delete(n)
-    db.commit()
+    await db.delete(n)
+    await versions.touch(db, user.id)
+    await db.commit()
+    await publish(user.id, "note", "deleted", [n.id], n.application_id)
     return {"ok": True}
@@ -1,45 +1,53 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
-from datetime import datetime, timezone
 from ..deps import get_db, get_current_user
+from ..http_cache import user_conditional
+from ..realtime import publish
 from ..models import Application, Reminder, User
 from ..schemas import ReminderIn, ReminderOut
+from ..services import versions
+from ..services.notifier import get_notifier
+from ..services.reminders import dispatch_due
 
 router = APIRouter(prefix="/reminders", tags=["reminders"])
 
 
 @router.get("/{application_id}", response_model=list[ReminderOut])
-def list_reminders(
+async def list_reminders(
     application_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    app = (
-        db.query(Application)
-        .filter(Application.id == application_id, Application.user_id == user.id)
-        .first()
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
+    app = await db.scalar(
+        select(Application).where(Application.id == application_id, Application.user_id == user.id)
     )
     if not app:
         raise HTTPException(404, "Application not found")
     return (
-        db.query(Reminder)
-        .filter(Reminder.application_id == application_id)
-        .order_by(Reminder.due_at.asc())
-        .all()
-    )
+        await db.scalars(
+            select(Reminder)
+            .where(Reminder.application_id == application_id)
+            .order_by(Reminder.due_at.asc())
+        )
+    ).all()
 
 
 @router.post("", response_model=ReminderOut)
-def create_reminder(
+async def create_reminder(
     body: ReminderIn,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    app = (
-        db.query(Application)
-        .filter(Application.id == body.application_id, Application.user_id == user.id)
-        .first()
+    app = await db.scalar(
+        select(Application).where(
+            Application.id == body.application_id, Application.user_id == user.id
+        )
     )
     if not app:
         raise HTTPException(404, "Application not found")
@@ -51,46 +59,38 @@ def create_reminder(
         sent=False,
     )
     db.add(r)
-    db.commit()
-    db.refresh(r)
+    await versions.touch(db, user.id)
+    await db.commit()
+    await db.refresh(r)
+    await publish(user.id, "reminder", "created", [r.id], r.application_id)
     return r
 
 
 @router.delete("/{reminder_id}")
-def delete_reminder(
+async def delete_reminder(
     reminder_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    r = (
-        db.query(Reminder)
+    r = await db.scalar(
+        select(Reminder)
         .join(Application, Reminder.application_id == Application.id)
-        .filter(Reminder.id == reminder_id, Application.user_id == user.id)
-        .first()
+        .where(Reminder.id == reminder_id, Application.user_id == user.id)
     )
     if not r:
         raise HTTPException(404, "Not found")
-    db.delete(r)
-    db.commit()
+    await db.delete(r)
+    await versions.touch(db, user.id)
+    await db.commit()
+    await publish(user.id, "reminder", "deleted", [r.id], r.application_id)
     return {"ok": True}
 
 
 @router.post("/run-due")
-def run_due_reminders(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    # simple local "scheduler" you can hit manually
-    now = datetime.now(timezone.utc)
-    due = (
-        db.query(Reminder)
-        .join(Application, Reminder.application_id == Application.id)
-        .filter(
-            Application.user_id == user.id,
-            Reminder.sent.is_(False),
-            Reminder.due_at <= now,
-        )
-        .all()
-    )
-    for r in due:
-        # TODO: integrate email/Slack here
-        r.sent = True
-    db.commit()
-    return {"sent_count": len(due)}
+async def run_due_reminders(
+    db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)
+):
+    # manual trigger for the current user's due reminders; the background
+    # dispatcher (app/services/reminders.py) handles everyone else
+    sent = await dispatch_due(db, get_notifier(), user_id=user.id)
+    return {"sent_count": sent}
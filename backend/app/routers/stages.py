@@ -1,45 +1,58 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
+from collections import Counter
 from ..deps import get_db, get_current_user
+from ..http_cache import user_conditional
+from ..realtime import publish
 from ..models import Application, Stage, StageType, User
 from ..schemas import StageIn, StageOut
+from ..services import stats, timeline, versions
 
 router = APIRouter(prefix="/stages", tags=["stages"])
 
 
 @router.get("/{application_id}", response_model=list[StageOut])
-def list_stages(
+async def list_stages(
     application_id: str,
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    app = (
-        db.query(Application)
-        .filter(Application.id == application_id, Application.user_id == user.id)
-        .first()
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
+    app = await db.scalar(
+        select(Application).where(Application.id == application_id, Application.user_id == user.id)
     )
     if not app:
         raise HTTPException(404, "Application not found")
     return (
-        db.query(Stage)
-        .filter(Stage.application_id == application_id)
-        .order_by(Stage.created_at.desc())
-        .all()
-    )
+        await db.scalars(
+            select(Stage)
+            .where(Stage.application_id == application_id)
+            .order_by(Stage.created_at.desc())
+        )
+    ).all()
 
 
 @router.post("", response_model=StageOut)
-def create_stage(
-    body: StageIn, db: Session = Depends(get_db), user: User = Depends(get_current_user)
+async def create_stage(
+    body: StageIn, db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)
 ):
-    app = (
-        db.query(Application)
-        .filter(Application.id == body.application_id, Application.user_id == user.id)
-        .first()
+    app = await db.scalar(
+        select(Application).where(
+            Application.id == body.application_id, Application.user_id == user.id
+        )
     )
     if not app:
         raise HTTPException(404, "Application not found")
+    first_of_type = not await db.scalar(
+        select(Stage.id).where(
+            Stage.application_id == body.application_id, Stage.type == StageType(body.type)
+        )
+    )
     s = Stage(
         id=str(uuid.uuid4()),
         application_id=body.application_id,
@@ -49,23 +62,40 @@ def create_stage(
         notes=body.notes,
     )
     db.add(s)
-    db.commit()
-    db.refresh(s)
+    if first_of_type:
+        await stats.bump(db, user.id, Counter({(stats.STAGE, s.type.value): 1}))
+    await timeline.record(
+        db,
+        timeline.event(
+            user.id, app.id, timeline.STAGE_ADDED, data={"stage_id": s.id, "type": s.type.value}
+        ),
+    )
+    await versions.touch(db, user.id)
+    await db.commit()
+    await db.refresh(s)
+    await publish(user.id, "stage", "created", [s.id], s.application_id)
     return s
 
 
 @router.delete("/{stage_id}")
-def delete_stage(
-    stage_id: str, db: Session = Depends(get_db), user: User = Depends(get_current_user)
+async def delete_stage(
+    stage_id: str, db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)
 ):
-    s = (
-        db.query(Stage)
+    s = await db.scalar(
+        select(Stage)
         .join(Application, Stage.application_id == Application.id)
-        .filter(Stage.id == stage_id, Application.user_id == user.id)
-        .first()
+        .where(Stage.id == stage_id, Application.user_id == user.id)
     )
     if not s:
         raise HTTPException(404, "Not found")
-    db.delete(s)
-    db.commit()
+    await db.delete(s)
+    await db.flush()
+    still_reached = await db.scalar(
+        select(Stage.id).where(Stage.application_id == s.application_id, Stage.type == s.type)
+    )
+    if not still_reached:
+        await stats.bump(db, user.id, Counter({(stats.STAGE, s.type.value): -1}))
+    await versions.touch(db, user.id)
+    await db.commit()
+    await publish(user.id, "stage", "deleted", [s.id], s.application_id)
     return {"ok": True}
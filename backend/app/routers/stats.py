@@ -0,0 +1,30 @@
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..deps import get_db, get_current_user
+from ..http_cache import user_conditional
+from ..models import User
+from ..schemas import StatsOut
+from ..services import stats, versions
+
+router = APIRouter(prefix="/stats", tags=["stats"])
+
+
+@router.get("", response_model=StatsOut)
+async def get_stats(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
+    return await stats.read(db, user.id)
+
+
+@router.post("/refresh", response_model=StatsOut)
+async def refresh_stats(db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)):
+    await stats.rebuild(db, user.id)
+    # the counters may have changed: retire the ETag clients revalidate GET /stats with
+    await versions.touch(db, user.id)
+    await db.commit()
+    return await stats.read(db, user.id)
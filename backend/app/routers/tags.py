@@ -1,70 +1,103 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 import uuid
 from ..deps import get_db, get_current_user
-from ..models import Tag, Application, User
-from ..schemas import TagIn, TagOut
+from ..http_cache import conditional
+from ..models import Tag, Application, User, application_tags
+from ..schemas import TagIn, TagOut, TagWithCount
+from ..services import tags, versions
 
 router = APIRouter(prefix="/tags", tags=["tags"])
 
 
-@router.get("", response_model=list[TagOut])
-def list_tags(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return db.query(Tag).order_by(Tag.name.asc()).all()
+@router.get("", response_model=list[TagWithCount])
+async def list_tags(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    # revalidated on every use like the other per-user lists: the SPA changes
+    # tags itself and must see its own writes (and the new counts) right away
+    version = await versions.current(db, user.id)
+    if not_modified := conditional(request, response, f"user:{user.id}", version):
+        return not_modified
+    return await tags.user_tags(db, user.id, version)
 
 
 @router.post("", response_model=TagOut)
-def create_tag(body: TagIn, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    if db.query(Tag).filter(Tag.name.ilike(body.name)).first():
+async def create_tag(
+    body: TagIn, db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)
+):
+    # served by the (user_id, lower(name)) unique index, which also settles races
+    taken = select(Tag.id).where(
+        Tag.user_id == user.id, func.lower(Tag.name) == func.lower(body.name)
+    )
+    if await db.scalar(taken):
         raise HTTPException(400, "Tag already exists")
-    t = Tag(id=str(uuid.uuid4()), name=body.name)
+    t = Tag(id=str(uuid.uuid4()), user_id=user.id, name=body.name)
     db.add(t)
-    db.commit()
-    db.refresh(t)
+    await versions.touch(db, user.id)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(400, "Tag already exists")
+    tags.invalidate(user.id)
+    await db.refresh(t)
     return t
 
 
+async def _check_owned(db: AsyncSession, application_id: str, tag_id: str, user_id: str) -> None:
+    app = select(Application.id).where(
+        Application.id == application_id, Application.user_id == user_id
+    )
+    if not await db.scalar(app):
+        raise HTTPException(404, "Application not found")
+    if not await db.scalar(select(Tag.id).where(Tag.id == tag_id, Tag.user_id == user_id)):
+        raise HTTPException(404, "Tag not found")
+
+
 @router.post("/assign/{application_id}/{tag_id}")
-def assign_tag(
+async def assign_tag(
     application_id: str,
     tag_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    app = (
-        db.query(Application)
-        .filter(Application.id == application_id, Application.user_id == user.id)
-        .first()
-    )
-    if not app:
-        raise HTTPException(404, "Application not found")
-    tag = db.query(Tag).filter(Tag.id == tag_id).first()
-    if not tag:
-        raise HTTPException(404, "Tag not found")
-    if tag not in app.tags:
-        app.tags.append(tag)
-        db.commit()
+    await _check_owned(db, application_id, tag_id, user.id)
+    try:
+        await db.execute(
+            insert(application_tags).values(application_id=application_id, tag_id=tag_id)
+        )
+    except IntegrityError:
+        # already assigned, possibly by a concurrent request: nothing to do
+        await db.rollback()
+        return {"ok": True}
+    await versions.touch(db, user.id)
+    await db.commit()
+    tags.invalidate(user.id)
     return {"ok": True}
 
 
 @router.delete("/assign/{application_id}/{tag_id}")
-def unassign_tag(
+async def unassign_tag(
     application_id: str,
     tag_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    app = (
-        db.query(Application)
-        .filter(Application.id == application_id, Application.user_id == user.id)
-        .first()
+    await _check_owned(db, application_id, tag_id, user.id)
+    result = await db.execute(
+        delete(application_tags).where(
+            application_tags.c.application_id == application_id,
+            application_tags.c.tag_id == tag_id,
+        )
     )
-    if not app:
-        raise HTTPException(404, "Application not found")
-    tag = db.query(Tag).filter(Tag.id == tag_id).first()
-    if not tag:
-        raise HTTPException(404, "Tag not found")
-    if tag in app.tags:
-        app.tags.remove(tag)
-        db.commit()
+    if result.rowcount:
+        await versions.touch(db, user.id)
+        await db.commit()
+        tags.invalidate(user.id)
     return {"ok": True}
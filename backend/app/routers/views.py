@@ -0,0 +1,172 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import uuid
+from typing import cast
+from ..config import settings
+from ..deps import get_db, get_current_user
+from ..http_cache import conditional, user_conditional
+from ..models import Application, SavedView, Tag, User
+from ..realtime import publish
+from ..schemas import (
+    ApplicationOut,
+    ApplicationQuery,
+    SavedViewIn,
+    SavedViewOut,
+    TagModeLiteral,
+)
+from ..services import versions, views
+from .applications import _apply_filters
+
+router = APIRouter(prefix="/views", tags=["views"])
+
+
+async def _get_view(db: AsyncSession, view_id: str, user_id: str) -> SavedView:
+    view = await db.scalar(
+        select(SavedView).where(SavedView.id == view_id, SavedView.user_id == user_id)
+    )
+    if not view:
+        raise HTTPException(404, "View not found")
+    return view
+
+
+async def _name_taken(db: AsyncSession, user_id: str, name: str, view_id: str | None = None):
+    stmt = select(SavedView.id).where(SavedView.user_id == user_id, SavedView.name == name)
+    if view_id:
+        stmt = stmt.where(SavedView.id != view_id)
+    return await db.scalar(stmt) is not None
+
+
+async def _check_tags(db: AsyncSession, user_id: str, tag_ids: list[str] | None) -> None:
+    if not tag_ids:
+        return
+    owned = await db.scalars(select(Tag.id).where(Tag.id.in_(tag_ids), Tag.user_id == user_id))
+    if set(tag_ids) - set(owned):
+        raise HTTPException(400, "Unknown tag")
+
+
+@router.get("", response_model=list[SavedViewOut])
+async def list_views(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
+    stmt = select(SavedView).where(SavedView.user_id == user.id).order_by(SavedView.name.asc())
+    return (await db.scalars(stmt)).all()
+
+
+@router.post("", response_model=SavedViewOut)
+async def create_view(
+    body: SavedViewIn, db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)
+):
+    if await _name_taken(db, user.id, body.name):
+        raise HTTPException(400, "View already exists")
+    await _check_tags(db, user.id, body.tag_ids)
+    view = SavedView(id=str(uuid.uuid4()), user_id=user.id, **body.model_dump())
+    db.add(view)
+    await versions.touch(db, user.id)
+    await db.commit()
+    await db.refresh(view)
+    await publish(user.id, "view", "created", [view.id])
+    return view
+
+
+@router.get("/{view_id}", response_model=SavedViewOut)
+async def get_view(
+    view_id: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    if not_modified := await user_conditional(request, response, db, user.id):
+        return not_modified
+    return await _get_view(db, view_id, user.id)
+
+
+@router.patch("/{view_id}", response_model=SavedViewOut)
+async def update_view(
+    view_id: str,
+    body: SavedViewIn,
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    view = await _get_view(db, view_id, user.id)
+    if await _name_taken(db, user.id, body.name, view.id):
+        raise HTTPException(400, "View already exists")
+    await _check_tags(db, user.id, body.tag_ids)
+    for k, v in body.model_dump(exclude_unset=True).items():
+        setattr(view, k, v)
+    await versions.touch(db, user.id)
+    await db.commit()
+    await db.refresh(view)
+    await publish(user.id, "view", "updated", [view.id])
+    return view
+
+
+@router.delete("/{view_id}")
+async def delete_view(
+    view_id: str, db: AsyncSession = Depends(get_db), user: User = Depends(get_current_user)
+):
+    view = await _get_view(db, view_id, user.id)
+    await db.delete(view)
+    await versions.touch(db, user.id)
+    await db.commit()
+    await publish(user.id, "view", "deleted", [view_id])
+    return {"ok": True}
+
+
+@router.get("/{view_id}/applications", response_model=list[ApplicationOut])
+async def open_view(
+    view_id: str,
+    request: Request,
+    response: Response,
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    # the view's matching ids are cached in order, so a page is a slice plus a
+    # primary-key fetch; the data_version that drives ETags also keys the cache
+    version = await versions.current(db, user.id)
+    if not_modified := conditional(request, response, f"user:{user.id}", version):
+        return not_modified
+    view = await _get_view(db, view_id, user.id)
+    start = (page - 1) * page_size
+    ids = views.cached_ids(user.id, version, view.id)
+    if ids is None:
+        params = ApplicationQuery(
+            page=page,
+            page_size=page_size,
+            status=view.status,
+            company=view.company,
+            role=view.role,
+            q=view.q,
+            sort=view.sort,
+            tags=view.tag_ids,
+            tag_mode=cast(TagModeLiteral, view.tag_mode),
+        )
+        cap = settings.SAVED_VIEW_MAX_CACHED_IDS
+        ids = list(
+            (
+                await db.scalars(
+                    _apply_filters(db, select(Application.id), params, user.id).limit(cap + 1)
+                )
+            ).all()
+        )
+        if len(ids) > cap:
+            # too large to cache: page it in SQL like GET /applications does
+            stmt = _apply_filters(db, select(Application), params, user.id)
+            return (await db.scalars(stmt.offset(start).limit(page_size))).all()
+        views.store_ids(user.id, version, view.id, ids)
+    page_ids = ids[start : start + page_size]
+    if not page_ids:
+        return []
+    rows = await db.scalars(
+        select(Application).where(Application.id.in_(page_ids), Application.user_id == user.id)
+    )
+    by_id = {app.id: app for app in rows}
+    return [by_id[i] for i in page_ids if i in by_id]
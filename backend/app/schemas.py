@@ -54,6 +54,7 @@ class TokenOut(BaseModel):
 # ---------- Applications ----------
 
 StatusLiteral = Literal["APPLIED", "OA", "INTERVIEW", "ONSITE", "OFFER", "REJECTED"]
+TagModeLiteral = Literal["any", "all"]  # "any" tag matches, or "all" of them must
 
 
 class ApplicationIn(BaseModel):
@@ -86,6 +87,23 @@ class ApplicationOut(BaseModel):
     applied_at: Optional[datetime] = None
 
     last_update_at: datetime
+    tag_ids: Optional[list[str]] = None  # only filled in by GET /applications
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ApplicationSummary(BaseModel):
+    # what the list views render: no jd_text or salary
+    id: str
+    company: str
+    role: str
+    status: StatusLiteral
+    location: Optional[str] = None
+    source: Optional[str] = None
+    job_url: Optional[HttpUrl] = None
+    applied_at: Optional[datetime] = None
+    last_update_at: datetime
+    tag_ids: list[str] = []
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -99,6 +117,68 @@ class ApplicationQuery(BaseModel):
     location: Optional[str] = None  # <— added so you can filter by location
     q: Optional[str] = None  # free-text across company/role/jd_text
     sort: Optional[str] = None  # e.g. "-last_update_at", "company"
+    tags: Optional[list[str]] = None  # tag ids
+    tag_mode: TagModeLiteral = "any"
+
+
+class ImportRowError(BaseModel):
+    line: int
+    error: str
+
+
+class ImportResult(BaseModel):
+    inserted: int = 0
+    failed: int = 0
+    errors: list[ImportRowError] = []  # first IMPORT_MAX_REPORTED_ERRORS failures
+
+
+class BatchOp(BaseModel):
+    op: Literal["set_status", "delete", "add_tags", "remove_tags"]
+    ids: list[str] = Field(min_length=1)
+    status: Optional[StatusLiteral] = None  # required for set_status
+    tag_ids: list[str] = []  # required for add_tags / remove_tags
+
+
+class BatchIn(BaseModel):
+    operations: list[BatchOp] = Field(min_length=1, max_length=50)
+
+
+class BatchItemResult(BaseModel):
+    op_index: int
+    id: str
+    ok: bool
+    error: Optional[str] = None
+
+
+class BatchOut(BaseModel):
+    results: list[BatchItemResult]
+
+
+class ApplicationPage(BaseModel):
+    items: list[ApplicationOut]
+    next_cursor: Optional[str] = None  # None once the last page is reached
+
+
+class ApplicationEventOut(BaseModel):
+    id: str
+    application_id: str
+    kind: str
+    from_status: Optional[StatusLiteral] = None
+    to_status: Optional[StatusLiteral] = None
+    data: Optional[dict] = None
+    occurred_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ActivityPage(BaseModel):
+    items: list[ApplicationEventOut]
+    next_cursor: Optional[str] = None  # None once the last page is reached
+
+
+class ApplicationSearchHit(ApplicationOut):
+    rank: float = 0.0
+    snippet: Optional[str] = None  # matched text with <mark>...</mark> highlights
 
 
 # ---------- S3 presign ----------
@@ -111,6 +191,33 @@ class PresignIn(BaseModel):
     size_bytes: Optional[int] = None
 
 
+class PresignOut(BaseModel):
+    upload_url: str
+    s3_key: str
+
+
+class PresignBatchIn(BaseModel):
+    files: list[PresignIn] = Field(min_length=1)
+
+
+class PresignBatchOut(BaseModel):
+    uploads: list[PresignOut]  # same order as the request's files
+
+
+class DownloadBatchIn(BaseModel):
+    document_ids: list[str] = Field(min_length=1)
+
+
+class DownloadUrlOut(BaseModel):
+    id: str
+    url: str
+
+
+class DownloadBatchOut(BaseModel):
+    urls: list[DownloadUrlOut]
+    missing: list[str] = []  # ids that do not exist or belong to someone else
+
+
 # ---------- Notes ----------
 
 
@@ -206,3 +313,57 @@ class TagOut(BaseModel):
     name: str
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class TagWithCount(TagOut):
+    count: int = 0  # applications carrying the tag
+
+
+# ---------- Saved views ----------
+
+
+class SavedViewIn(BaseModel):
+    name: str = Field(min_length=1, max_length=100)
+    status: Optional[StatusLiteral] = None
+    company: Optional[str] = None
+    role: Optional[str] = None
+    q: Optional[str] = None
+    sort: Optional[str] = None  # same values as GET /applications?sort=
+    tag_ids: Optional[list[str]] = None  # same as GET /applications?tags=
+    tag_mode: TagModeLiteral = "any"
+
+
+class SavedViewOut(SavedViewIn):
+    id: str
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+# ---------- Application detail (aggregate) ----------
+
+
+class ApplicationFull(ApplicationOut):
+    notes: Optional[list[NoteOut]] = None
+    stages: Optional[list[StageOut]] = None
+    contacts: Optional[list[ContactOut]] = None
+    reminders: Optional[list[ReminderOut]] = None
+    documents: Optional[list[DocumentOut]] = None
+    tags: Optional[list[TagOut]] = None
+
+
+# ---------- Stats ----------
+
+
+class WeekCount(BaseModel):
+    week: str  # ISO date of the Monday starting the week
+    count: int
+
+
+class StatsOut(BaseModel):
+    total: int
+    by_status: dict[str, int]
+    applied_per_week: list[WeekCount]
+    stages_reached: dict[str, int]  # applications with at least one stage of each type
+    stage_conversion: dict[str, float]  # stages_reached / total
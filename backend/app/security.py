@@ -1,10 +1,19 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from jose import jwt
 from passlib.context import CryptContext
 from .config import settings
 
 ALGORITHM = "HS256"
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# min == max == default, so any change to BCRYPT_ROUNDS marks old hashes for rehash
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
 
 
 # Password hashing
@@ -16,11 +25,46 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+class HashingBusy(Exception):
+    """Raised when the password hashing pool is saturated."""
+
+
+# bcrypt gets its own small pool so login bursts can't starve the shared
+# threadpool the rest of the API relies on
+_hash_pool = ThreadPoolExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="pwhash"
+)
+_hash_pending = 0
+
+
+async def _run_hashing(fn, *args):
+    global _hash_pending
+    if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise HashingBusy()
+    _hash_pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_pool, fn, *args)
+    finally:
+        _hash_pending -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_hashing(hash_password, password)
+
+
+async def verify_and_update_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify a password; also returns a new hash when the stored one uses
+    outdated parameters (None otherwise)."""
+    return await _run_hashing(pwd_context.verify_and_update, plain_password, hashed_password)
+
+
 # JWT: keep the name expected by auth.py
-def create_token(sub: str, minutes: int | None = None) -> str:
+def create_token(sub: str, minutes: int | None = None, **claims) -> str:
     exp_minutes = minutes if minutes is not None else settings.JWT_EXPIRE_MINUTES
     expire = datetime.utcnow() + timedelta(minutes=exp_minutes)
-    payload = {"sub": sub, "exp": expire}
+    payload = {**claims, "sub": sub, "exp": expire}
     return jwt.encode(payload, settings.JWT_SECRET, algorithm=ALGORITHM)
 
 
@@ -0,0 +1,68 @@
+# app/services/importer.py
+import csv
+import json
+from typing import AsyncIterator, Iterator
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Split a byte stream into decoded lines without buffering the whole body."""
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8-sig").rstrip("\r")
+    if pending:
+        yield pending.decode("utf-8-sig").rstrip("\r")
+
+
+async def iter_jsonl(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, dict | str]]:
+    """Yield (line number, record) — or (line number, error message) for bad lines."""
+    lineno = 0
+    async for line in lines:
+        lineno += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            yield lineno, f"invalid JSON: {e}"
+            continue
+        yield lineno, record if isinstance(record, dict) else "expected a JSON object"
+
+
+def _parse_csv(text: str) -> list[str]:
+    reader: Iterator[list[str]] = csv.reader([text])
+    return next(reader, [])
+
+
+async def iter_csv(lines: AsyncIterator[str]) -> AsyncIterator[tuple[int, dict | str]]:
+    """Like iter_jsonl but for CSV with a header row; empty cells become None.
+
+    A record may span several physical lines inside a quoted field, so lines
+    are accumulated until the quote count balances.
+    """
+    header: list[str] | None = None
+    buf: list[str] = []
+    start = lineno = 0
+    async for line in lines:
+        lineno += 1
+        if not buf:
+            start = lineno
+        buf.append(line)
+        text = "\n".join(buf)
+        if text.count('"') % 2:
+            continue  # still inside a quoted field
+        buf = []
+        if not text.strip():
+            continue
+        cells = _parse_csv(text)
+        if header is None:
+            header = [h.strip() for h in cells]
+            continue
+        if len(cells) != len(header):
+            yield start, f"expected {len(header)} columns, got {len(cells)}"
+            continue
+        yield start, {k: (v if v != "" else None) for k, v in zip(header, cells)}
+    if buf:
+        yield start, "unterminated quoted field"
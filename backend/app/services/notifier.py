@@ -0,0 +1,50 @@
+# app/services/notifier.py
+import json
+import smtplib
+import threading
+from datetime import datetime
+from email.message import EmailMessage
+from typing import Protocol
+
+from ..config import settings
+
+
+class Notifier(Protocol):
+    def send(self, to: str, subject: str, body: str) -> None: ...
+
+
+class FileNotifier:
+    """Appends each notification as a JSON line; handy for local dev and tests."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def send(self, to: str, subject: str, body: str) -> None:
+        line = json.dumps(
+            {"to": to, "subject": subject, "body": body, "at": datetime.utcnow().isoformat()}
+        )
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+
+
+class SMTPNotifier:
+    def __init__(self, host: str, port: int, sender: str):
+        self.host = host
+        self.port = port
+        self.sender = sender
+
+    def send(self, to: str, subject: str, body: str) -> None:
+        msg = EmailMessage()
+        msg["From"] = self.sender
+        msg["To"] = to
+        msg["Subject"] = subject
+        msg.set_content(body)
+        with smtplib.SMTP(self.host, self.port, timeout=10) as smtp:
+            smtp.send_message(msg)
+
+
+def get_notifier() -> Notifier:
+    if settings.REMINDER_NOTIFIER == "smtp":
+        return SMTPNotifier(settings.SMTP_HOST, settings.SMTP_PORT, settings.SMTP_FROM)
+    return FileNotifier(settings.REMINDER_OUTBOX_PATH)
@@ -0,0 +1,140 @@
+# app/services/reminders.py
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from sqlalchemy import false, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..db import AsyncSessionLocal, async_engine
+from ..models import Application, Reminder, User
+from ..realtime import publish
+from . import timeline, versions
+from .notifier import Notifier, get_notifier
+
+log = logging.getLogger(__name__)
+
+
+def _backoff(attempts: int) -> timedelta:
+    return timedelta(seconds=settings.REMINDER_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+
+
+def _reminder_event(user_id: str, reminder: Reminder, kind: str) -> dict:
+    data = {"reminder_id": reminder.id, "attempts": reminder.attempts}
+    if reminder.last_error:
+        data["error"] = reminder.last_error
+    return timeline.event(user_id, reminder.application_id, kind, data=data)
+
+
+async def dispatch_due(
+    db: AsyncSession,
+    notifier: Notifier,
+    user_id: str | None = None,
+    limit: int | None = None,
+) -> int:
+    """Claim one batch of due reminders, deliver them and record the outcome.
+
+    Rows are picked with FOR UPDATE SKIP LOCKED and leased by pushing
+    next_attempt_at out by REMINDER_CLAIM_LEASE_SECONDS, then that transaction
+    commits: delivery runs without holding locks or a connection, so any number
+    of workers can run this concurrently without double-sending. A worker that
+    dies mid-batch leaves its claims to be retried once the lease runs out.
+    Returns the number sent.
+    """
+    # naive UTC, like every other timestamp column in the schema
+    now = datetime.utcnow()
+    stmt = (
+        select(Reminder, Application.user_id, User.email, Application.company, Application.role)
+        .join(Application, Reminder.application_id == Application.id)
+        .join(User, Application.user_id == User.id)
+        .where(
+            # "= false" matches the ix_reminders_due_unsent predicate
+            Reminder.sent == false(),
+            Reminder.due_at <= now,
+            Reminder.attempts < settings.REMINDER_MAX_ATTEMPTS,
+            or_(Reminder.next_attempt_at.is_(None), Reminder.next_attempt_at <= now),
+        )
+        .order_by(Reminder.due_at)
+        .limit(limit or settings.REMINDER_BATCH_SIZE)
+        .with_for_update(of=Reminder, skip_locked=True)
+    )
+    if user_id is not None:
+        stmt = stmt.where(Application.user_id == user_id)
+
+    claimed = (await db.execute(stmt)).all()
+    lease_until = now + timedelta(seconds=settings.REMINDER_CLAIM_LEASE_SECONDS)
+    for row in claimed:
+        row.Reminder.next_attempt_at = lease_until
+    await db.commit()
+    if not claimed:
+        return 0
+
+    errors: dict[str, str] = {}
+    for reminder, _, email, company, role in claimed:
+        try:
+            await asyncio.to_thread(
+                notifier.send, email, f"Reminder: {company} — {role}", reminder.message
+            )
+        except Exception as e:
+            errors[reminder.id] = str(e)[:1000]
+            log.warning("reminder %s delivery failed: %s", reminder.id, e)
+
+    # short second transaction: record every outcome and release the lease
+    owners = {row.Reminder.id: row.user_id for row in claimed}
+    rows = await db.scalars(select(Reminder).where(Reminder.id.in_(owners)))
+    sent = 0
+    events = []
+    for reminder in rows:
+        reminder.attempts = (reminder.attempts or 0) + 1
+        error = errors.get(reminder.id)
+        if error is None:
+            reminder.sent = True
+            reminder.next_attempt_at = None
+            reminder.last_error = None
+            sent += 1
+            kind = timeline.REMINDER_SENT
+        else:
+            reminder.next_attempt_at = now + _backoff(reminder.attempts)
+            reminder.last_error = error
+            kind = timeline.REMINDER_FAILED
+        events.append(_reminder_event(owners[reminder.id], reminder, kind))
+    await timeline.record(db, *events)
+    await versions.touch(db, *owners.values())
+    await db.commit()
+    for row in claimed:
+        # attempts/sent changed either way; open tabs refetch the reminder list
+        await publish(
+            row.user_id, "reminder", "updated", [row.Reminder.id], row.Reminder.application_id
+        )
+    return sent
+
+
+async def run_dispatcher(stop: asyncio.Event, notifier: Notifier | None = None) -> None:
+    """Poll for due reminders until `stop` is set; drains full batches back to back."""
+    notifier = notifier or get_notifier()
+    while not stop.is_set():
+        try:
+            async with AsyncSessionLocal() as db:
+                sent = await dispatch_due(db, notifier)
+            if sent >= settings.REMINDER_BATCH_SIZE:
+                continue
+        except Exception:
+            log.exception("reminder dispatch failed")
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=settings.REMINDER_POLL_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def _main() -> None:
+    try:
+        await run_dispatcher(asyncio.Event())
+    finally:
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    # standalone worker: python -m app.services.reminders
+    logging.basicConfig(level=settings.LOG_LEVEL.upper())
+    asyncio.run(_main())
@@ -1,25 +1,78 @@
 # app/services/s3.py
-import boto3
-import os
+import asyncio
+import threading
 from urllib.parse import quote
 
-_s3 = boto3.client("s3", region_name=os.getenv("AWS_REGION"))
-_BUCKET = os.getenv("AWS_S3_BUCKET", "")
+import boto3
+from botocore.config import Config
+
+from ..cache import TTLCache
+from ..config import settings
+
+_client = None
+_client_lock = threading.Lock()
+# presigned GET URLs by key; reused until PRESIGN_CACHE_MARGIN_SECONDS before expiry
+_get_urls = TTLCache(maxsize=settings.PRESIGN_CACHE_MAX_ENTRIES, ttl=0)
 
 
-def presign_put(filename: str, content_type: str, expires_in: int = 3600):
+def _s3():
+    # built on first use rather than at import: creating a client loads the
+    # service model, and resolving credentials may call out to the metadata
+    # service. The session caches (and refreshes) the credentials afterwards.
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                session = boto3.session.Session(region_name=settings.AWS_REGION or None)
+                _client = session.client(
+                    "s3",
+                    endpoint_url=settings.AWS_S3_ENDPOINT_URL or None,
+                    config=Config(
+                        signature_version="s3v4",
+                        max_pool_connections=settings.S3_MAX_POOL_CONNECTIONS,
+                        retries={"mode": "standard", "max_attempts": 3},
+                        connect_timeout=5,
+                        read_timeout=30,
+                        tcp_keepalive=True,
+                    ),
+                )
+    return _client
+
+
+def presign_put(filename: str, content_type: str, expires_in: int | None = None):
     key = f"uploads/{quote(filename)}"
-    url = _s3.generate_presigned_url(
+    url = _s3().generate_presigned_url(
         "put_object",
-        Params={"Bucket": _BUCKET, "Key": key, "ContentType": content_type},
-        ExpiresIn=expires_in,
+        Params={"Bucket": settings.AWS_S3_BUCKET, "Key": key, "ContentType": content_type},
+        ExpiresIn=expires_in or settings.PRESIGN_EXPIRES_SECONDS,
     )
     return url, key
 
 
-def presign_get(key: str, expires_in: int = 3600):
-    return _s3.generate_presigned_url(
-        "get_object",
-        Params={"Bucket": _BUCKET, "Key": key},
-        ExpiresIn=expires_in,
-    )
+def presign_get(key: str, expires_in: int | None = None):
+    expires_in = expires_in or settings.PRESIGN_EXPIRES_SECONDS
+    cache_key = (key, expires_in)
+    url = _get_urls.get(cache_key)
+    if url is None:
+        url = _s3().generate_presigned_url(
+            "get_object",
+            Params={"Bucket": settings.AWS_S3_BUCKET, "Key": key},
+            ExpiresIn=expires_in,
+        )
+        ttl = expires_in - settings.PRESIGN_CACHE_MARGIN_SECONDS
+        if ttl > 0:
+            _get_urls.set(cache_key, url, ttl=ttl)
+    return url
+
+
+# signing is CPU work (and the first call builds the client), so the async
+# variants used by the routers run it in a worker thread, a whole batch per hop
+
+
+async def presign_put_batch(files: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """[(filename, content_type)] -> [(upload_url, key)], in order."""
+    return await asyncio.to_thread(lambda: [presign_put(name, ctype) for name, ctype in files])
+
+
+async def presign_get_batch(keys: list[str]) -> list[str]:
+    return await asyncio.to_thread(lambda: [presign_get(key) for key in keys])
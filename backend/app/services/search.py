@@ -0,0 +1,109 @@
+# app/services/search.py
+import re
+
+from sqlalchemy import func, or_, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Application
+
+# Postgres matches the generated, GIN-indexed Application.search_vector;
+# SQLite (tests / local dev) the applications_fts FTS5 table (see app/models.py).
+TS_CONFIG = "english"
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+
+def _dialect(db: AsyncSession) -> str:
+    return db.get_bind().dialect.name
+
+
+def _fts5_query(q: str) -> str:
+    # quote every term so user input can never be parsed as FTS5 syntax;
+    # trailing * gives prefix matching ("pyth" -> "python")
+    terms = re.findall(r"\w+", q)
+    return " ".join(f'"{t}"*' for t in terms)
+
+
+def match_clause(db: AsyncSession, q: str):
+    """WHERE clause restricting Application rows to full-text matches of `q`."""
+    dialect = _dialect(db)
+    if dialect == "postgresql":
+        return Application.search_vector.op("@@")(func.websearch_to_tsquery(TS_CONFIG, q))
+    if dialect == "sqlite":
+        return text(
+            "applications.rowid IN "
+            "(SELECT rowid FROM applications_fts WHERE applications_fts MATCH :fts_q)"
+        ).bindparams(fts_q=_fts5_query(q) or '""')
+    like = f"%{q}%"
+    return or_(
+        Application.company.ilike(like),
+        Application.role.ilike(like),
+        Application.location.ilike(like),
+        Application.jd_text.ilike(like),
+    )
+
+
+async def search_applications(db: AsyncSession, user_id: str, q: str, limit: int = 20):
+    """Ranked full-text search over a user's applications.
+
+    Returns a list of (Application, rank, snippet) tuples, best match first.
+    Snippets are only built for the returned page, never the whole match set.
+    """
+    dialect = _dialect(db)
+    if dialect == "postgresql":
+        tsq = func.websearch_to_tsquery(TS_CONFIG, q)
+        rank = func.ts_rank_cd(Application.search_vector, tsq).label("rank")
+        top = (
+            select(Application.id, rank)
+            .where(Application.user_id == user_id, Application.search_vector.op("@@")(tsq))
+            .order_by(rank.desc(), Application.id)
+            .limit(limit)
+            .subquery()
+        )
+        snippet = func.ts_headline(
+            TS_CONFIG,
+            func.concat_ws(" ", Application.company, Application.role, Application.jd_text),
+            tsq,
+            f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, MaxFragments=2",
+        )
+        stmt = (
+            select(Application, top.c.rank, snippet)
+            .join(top, top.c.id == Application.id)
+            .order_by(top.c.rank.desc(), Application.id)
+        )
+        return [tuple(row) for row in (await db.execute(stmt)).all()]
+
+    if dialect == "sqlite":
+        fts_q = _fts5_query(q)
+        if not fts_q:
+            return []
+        ids = (
+            await db.execute(
+                text(
+                    "SELECT a.id, -bm25(applications_fts) AS rank, "
+                    "snippet(applications_fts, -1, :hs, :he, '…', 12) AS snippet "
+                    "FROM applications_fts JOIN applications a ON a.rowid = applications_fts.rowid "
+                    "WHERE applications_fts MATCH :q AND a.user_id = :uid "
+                    "ORDER BY rank DESC LIMIT :limit"
+                ),
+                {
+                    "q": fts_q,
+                    "uid": user_id,
+                    "limit": limit,
+                    "hs": HIGHLIGHT_START,
+                    "he": HIGHLIGHT_STOP,
+                },
+            )
+        ).all()
+        found = await db.scalars(select(Application).where(Application.id.in_([r.id for r in ids])))
+        apps = {a.id: a for a in found}
+        return [(apps[r.id], r.rank, r.snippet) for r in ids if r.id in apps]
+
+    # other backends: unindexed substring match, no ranking
+    rows = await db.scalars(
+        select(Application)
+        .where(Application.user_id == user_id, match_clause(db, q))
+        .order_by(Application.last_update_at.desc())
+        .limit(limit)
+    )
+    return [(a, 0.0, None) for a in rows]
@@ -0,0 +1,119 @@
+# app/services/stats.py
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Iterable
+
+from sqlalchemy import delete, distinct, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import Application, Stage, StatCounter, Status
+
+STATUS = "status"
+APPLIED_WEEK = "applied_week"
+STAGE = "stage"  # applications that reached a StageType at least once
+
+
+def week_key(dt: datetime | None) -> str | None:
+    # weeks start on Monday, keyed by that day's ISO date
+    if dt is None:
+        return None
+    return (dt.date() - timedelta(days=dt.weekday())).isoformat()
+
+
+def app_deltas(status: Status | str, applied_at: datetime | None, sign: int = 1) -> Counter:
+    deltas: Counter = Counter()
+    deltas[(STATUS, Status(status).value)] += sign
+    week = week_key(applied_at)
+    if week:
+        deltas[(APPLIED_WEEK, week)] += sign
+    return deltas
+
+
+async def bump(db: AsyncSession, user_id: str, deltas: Counter) -> None:
+    """Add `deltas` ({(kind, key): n}) to the user's counters in one upsert.
+
+    Runs in the caller's transaction so counters commit with the change.
+    """
+    rows = [
+        {"user_id": user_id, "kind": kind, "key": key, "count": n}
+        for (kind, key), n in deltas.items()
+        if n
+    ]
+    if not rows:
+        return
+    dialect = db.get_bind().dialect.name
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = insert(StatCounter).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[StatCounter.user_id, StatCounter.kind, StatCounter.key],
+        set_={"count": StatCounter.count + stmt.excluded.count},
+    )
+    await db.execute(stmt)
+
+
+async def stage_types(db: AsyncSession, app_ids: Iterable[str]) -> Counter:
+    """Distinct (STAGE, type) pairs per application, as deltas of +1."""
+    rows = await db.execute(
+        select(distinct(Stage.application_id), Stage.type).where(
+            Stage.application_id.in_(list(app_ids))
+        )
+    )
+    return Counter((STAGE, t.value) for _, t in rows.all())
+
+
+async def rebuild(db: AsyncSession, user_id: str) -> None:
+    """Recompute the user's counters from the source tables (backfill / repair)."""
+    await db.execute(delete(StatCounter).where(StatCounter.user_id == user_id))
+    deltas: Counter = Counter()
+    by_status = await db.execute(
+        select(Application.status, func.count())
+        .where(Application.user_id == user_id)
+        .group_by(Application.status)
+    )
+    for status, n in by_status.all():
+        deltas[(STATUS, status.value)] += n
+    applied = await db.execute(
+        select(Application.applied_at).where(
+            Application.user_id == user_id, Application.applied_at.is_not(None)
+        )
+    )
+    for (applied_at,) in applied.all():
+        deltas[(APPLIED_WEEK, week_key(applied_at))] += 1
+    reached = await db.execute(
+        select(Stage.type, func.count(distinct(Stage.application_id)))
+        .join(Application, Stage.application_id == Application.id)
+        .where(Application.user_id == user_id)
+        .group_by(Stage.type)
+    )
+    for stage_type, n in reached.all():
+        deltas[(STAGE, stage_type.value)] += n
+    await bump(db, user_id, deltas)
+
+
+async def read(db: AsyncSession, user_id: str) -> dict:
+    rows = (
+        await db.execute(
+            select(StatCounter.kind, StatCounter.key, StatCounter.count).where(
+                StatCounter.user_id == user_id
+            )
+        )
+    ).all()
+    by_status = {s.value: 0 for s in Status}
+    weeks: dict[str, int] = {}
+    stages: dict[str, int] = {}
+    for kind, key, count in rows:
+        if kind == STATUS:
+            by_status[key] = count
+        elif kind == APPLIED_WEEK and count:
+            weeks[key] = count
+        elif kind == STAGE and count:
+            stages[key] = count
+    total = sum(by_status.values())
+    return {
+        "total": total,
+        "by_status": by_status,
+        "applied_per_week": [{"week": w, "count": weeks[w]} for w in sorted(weeks)],
+        "stages_reached": stages,
+        "stage_conversion": {k: (v / total if total else 0.0) for k, v in stages.items()},
+    }
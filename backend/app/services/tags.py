@@ -0,0 +1,35 @@
+# app/services/tags.py
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..cache import TTLCache
+from ..config import settings
+from ..models import Tag, application_tags
+
+# user id -> (data_version, [{"id", "name", "count"}, ...] sorted by name).
+# Stamped like saved views: a write committed by another worker bumps the
+# version, so a stale list is never served; invalidate() frees it early.
+_lists = TTLCache(settings.TAG_CACHE_MAX_USERS, settings.TAG_CACHE_TTL_SECONDS)
+
+
+async def user_tags(db: AsyncSession, user_id: str, version: int) -> list[dict]:
+    """The user's tags with usage counts; one aggregate over their tags on a miss."""
+    entry = _lists.get(user_id)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+    rows = await db.execute(
+        select(Tag.id, Tag.name, func.count(application_tags.c.application_id).label("count"))
+        .outerjoin(application_tags, application_tags.c.tag_id == Tag.id)
+        .where(Tag.user_id == user_id)
+        .group_by(Tag.id, Tag.name)
+        .order_by(Tag.name.asc())
+    )
+    tags = [row._asdict() for row in rows]
+    if entry is None or entry[0] <= version:
+        _lists.set(user_id, (version, tags))
+    return tags
+
+
+def invalidate(*user_ids: str) -> None:
+    for user_id in user_ids:
+        _lists.pop(user_id)
@@ -0,0 +1,49 @@
+# app/services/timeline.py
+import uuid
+from datetime import datetime
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import ApplicationEvent, Status
+
+CREATED = "created"
+UPDATED = "updated"
+STATUS_CHANGED = "status_changed"
+DELETED = "deleted"
+STAGE_ADDED = "stage_added"
+REMINDER_SENT = "reminder_sent"
+REMINDER_FAILED = "reminder_failed"
+
+
+def _status(value: Status | str | None) -> str | None:
+    return Status(value).value if value is not None else None
+
+
+def event(
+    user_id: str,
+    application_id: str,
+    kind: str,
+    *,
+    from_status: Status | str | None = None,
+    to_status: Status | str | None = None,
+    data: dict | None = None,
+    occurred_at: datetime | None = None,
+) -> dict:
+    """One application_events row, ready for `record`."""
+    return dict(
+        id=str(uuid.uuid4()),
+        user_id=user_id,
+        application_id=application_id,
+        kind=kind,
+        from_status=_status(from_status),
+        to_status=_status(to_status),
+        data=data,
+        occurred_at=occurred_at or datetime.utcnow(),
+    )
+
+
+async def record(db: AsyncSession, *events: dict) -> None:
+    """Append events in one executemany, inside the caller's transaction."""
+    if events:
+        await db.execute(insert(ApplicationEvent), list(events))
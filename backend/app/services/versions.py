@@ -0,0 +1,25 @@
+# app/services/versions.py
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..models import User
+
+
+async def touch(db: AsyncSession, *user_ids: str) -> None:
+    """Bump the users' data_version, invalidating every ETag handed out for their data.
+
+    Runs in the caller's transaction so the new version commits with the change.
+    """
+    ids = {uid for uid in user_ids if uid}
+    if not ids:
+        return
+    await db.execute(
+        update(User)
+        .where(User.id.in_(ids))
+        .values(data_version=User.data_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def current(db: AsyncSession, user_id: str) -> int:
+    return await db.scalar(select(User.data_version).where(User.id == user_id)) or 0
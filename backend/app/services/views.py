@@ -0,0 +1,32 @@
+# app/services/views.py
+from ..cache import TTLCache
+from ..config import settings
+
+# user id -> (data_version, {view id: application ids in the view's sort order}).
+# Entries stamped with an older data_version are ignored, so a write committed
+# by another worker invalidates them too; invalidate() just frees them early.
+_results = TTLCache(settings.SAVED_VIEW_CACHE_MAX_USERS, settings.SAVED_VIEW_CACHE_TTL_SECONDS)
+
+
+def cached_ids(user_id: str, version: int, view_id: str) -> list[str] | None:
+    entry = _results.get(user_id)
+    if entry is None or entry[0] != version:
+        return None
+    return entry[1].get(view_id)
+
+
+def store_ids(user_id: str, version: int, view_id: str, ids: list[str]) -> None:
+    entry = _results.get(user_id)
+    if entry is not None and entry[0] > version:
+        return  # computed from a snapshot a newer write has already replaced
+    if entry is None or entry[0] != version:
+        entry = (version, {})
+        _results.set(user_id, entry)
+    entry[1][view_id] = ids
+
+
+def invalidate(*user_ids: str) -> None:
+    """Drop the users' cached view results; call after committing a change to
+    which applications they own, or to any field views filter or sort on."""
+    for user_id in user_ids:
+        _results.pop(user_id)
@@ -0,0 +1,242 @@
+# bench/indexes.py
+"""Index advisor: capture the SQL the hot read routes issue, EXPLAIN each
+statement on seeded data and propose an index wherever the planner still
+answers with a full table scan or an explicit sort.
+
+    python -m bench.indexes --users 5 --apps 2000
+    python -m bench.indexes --database-url postgresql+asyncpg://.../scratch
+
+Seeds exactly like bench.run (the database is wiped). Exits 1 when a captured
+statement scans or sorts a table of at least --min-rows rows, so it can gate
+CI after a schema or query change. Proposals are heuristics read off the SQL
+(equality columns, then range columns, then ORDER BY; constant predicates
+become a partial index): review them before turning one into a migration.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+
+from .run import DEFAULT_DB
+
+
+@dataclass
+class Finding:
+    label: str  # the route that issued the statement
+    statement: str
+    problems: list[tuple[str, str]] = field(default_factory=list)  # (scan|sort, table)
+    plan: list[str] = field(default_factory=list)
+
+
+def _requests(ctx) -> list[tuple[str, str, str, dict | None]]:
+    """(label, method, path, params-or-body) for every hot read path."""
+    app = ctx["app"]
+    return [
+        ("list", "GET", "/applications", {"page_size": 50}),
+        ("list ?status", "GET", "/applications", {"status": "INTERVIEW", "page_size": 50}),
+        ("list keyset", "GET", "/applications", {"sort": "company", "cursor": ""}),
+        # a page from the middle of the default (nullable, DESC) sort
+        ("list keyset deep", "GET", "/applications", {"cursor": ctx["cursor"], "page_size": 50}),
+        ("list summary", "GET", "/applications", {"fields": "summary", "page_size": 100}),
+        ("detail", "GET", f"/applications/{app}/full", None),
+        ("timeline", "GET", f"/applications/{app}/timeline", None),
+        ("notes", "GET", f"/notes/{app}", None),
+        ("stages", "GET", f"/stages/{app}", None),
+        ("reminders", "GET", f"/reminders/{app}", None),
+        ("contacts", "GET", f"/contacts/{app}", None),
+        ("documents", "GET", f"/documents/{app}", None),
+        ("activity", "GET", "/activity", None),
+        ("stats", "GET", "/stats", None),
+        ("tags", "GET", "/tags", None),
+        # an existing name: the route answers 400 right after the lookup
+        ("tag lookup", "POST", "/tags", {"name": ctx["tag"].upper()}),
+    ]
+
+
+# ---------- plans ----------
+
+
+def _sqlite_problems(rows) -> tuple[list[tuple[str, str]], list[str]]:
+    problems, plan = [], []
+    for row in rows:
+        detail = row[-1]
+        plan.append(detail)
+        # "SCAN t" is a full table scan; "SCAN t USING [COVERING] INDEX i" walks
+        # an index in order and "SEARCH t USING ..." is a seek, both fine
+        m = re.match(r"SCAN (\w+)(.*)", detail)
+        if m and "USING" not in m.group(2) and "VIRTUAL TABLE" not in m.group(2):
+            problems.append(("scan", m.group(1)))
+        if "TEMP B-TREE FOR ORDER BY" in detail:
+            problems.append(("sort", ""))
+    return problems, plan
+
+
+def _postgres_problems(rows) -> tuple[list[tuple[str, str]], list[str]]:
+    problems, plan = [], []
+    doc = rows[0][0]
+    doc = json.loads(doc) if isinstance(doc, str) else doc
+
+    def walk(node, depth=0):
+        relation = node.get("Relation Name", "")
+        plan.append(f"{'  ' * depth}{node['Node Type']} {relation}".rstrip())
+        if node["Node Type"] == "Seq Scan":
+            problems.append(("scan", relation))
+        elif node["Node Type"] in ("Sort", "Incremental Sort"):
+            problems.append(("sort", ""))
+        for child in node.get("Plans", []):
+            walk(child, depth + 1)
+
+    walk(doc[0]["Plan"])
+    return problems, plan
+
+
+async def _explain(conn, dialect: str, statement: str, parameters):
+    if dialect == "postgresql":
+        rows = (await conn.exec_driver_sql("EXPLAIN (FORMAT JSON) " + statement, parameters)).all()
+        return _postgres_problems(rows)
+    rows = (await conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)).all()
+    return _sqlite_problems(rows)
+
+
+# ---------- proposals ----------
+
+
+def _main_table(statement: str) -> str:
+    m = re.search(r"\bFROM (\w+)", statement)
+    return m.group(1) if m else ""
+
+
+def propose(statement: str, table: str) -> str | None:
+    """A CREATE INDEX for `table` read off the statement's WHERE and ORDER BY."""
+    where, _, order = statement.partition(" ORDER BY ")
+    where = where.split(" WHERE ", 1)[1] if " WHERE " in where else ""
+    order = re.split(r" LIMIT | OFFSET | FOR UPDATE", order)[0]
+    col = rf"(lower\({table}\.\w+\)|{table}\.\w+)"
+    constant = r"(?:IS NULL|IS NOT NULL|= (?:0|1|false|true)\b|IS (?:0|1|false|true)\b)"
+    partial = re.findall(rf"{col} ({constant})", where)
+    equality = [c for c in re.findall(rf"{col} (?:= |IN \()", where)]
+    ranges = re.findall(rf"{col} (?:<|>|<=|>=) ", where)
+    ordering = re.findall(col, order)
+    constant_cols = {c for c, _ in partial}
+    columns = []
+    for c in [*equality, *ranges, *ordering]:
+        c = c.replace(f"{table}.", "")
+        if c not in columns and f"{table}.{c}" not in constant_cols:
+            columns.append(c)
+    if not columns:
+        return None
+    name = "ix_" + "_".join([table, *(re.sub(r"\W+", "_", c).strip("_") for c in columns)])
+    sql = f"CREATE INDEX {name} ON {table} ({', '.join(columns)})"
+    if partial:
+        sql += " WHERE " + " AND ".join(f"{c.replace(f'{table}.', '')} {p}" for c, p in partial)
+    return sql
+
+
+# ---------- driver ----------
+
+
+async def main(args) -> int:
+    # settings are read at import time, so configure the DB before importing app
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("JWT_SECRET", "bench-secret")
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    import httpx
+    from sqlalchemy import event, select, text
+
+    from app.db import AsyncSessionLocal, async_engine
+    from app.main import app
+    from app.models import Application, Tag
+    from app.routers.applications import _encode_cursor
+    from app.security import create_token
+
+    from .seed import seed
+
+    print(f"seeding {args.users} users x {args.apps} applications ...", file=sys.stderr)
+    users = seed(args.users, args.apps)
+    async with AsyncSessionLocal() as db:
+        await db.execute(text("ANALYZE"))  # give the planner real statistics
+        await db.commit()
+        ctx = {
+            "app": await db.scalar(select(Application.id).where(Application.user_id == users[0])),
+            "tag": await db.scalar(select(Tag.name).where(Tag.user_id == users[0])),
+        }
+        middle = await db.scalar(
+            select(Application)
+            .where(Application.user_id == users[0])
+            .order_by(Application.id)
+            .offset(args.apps // 2)
+        )
+        ctx["cursor"] = _encode_cursor("last_update_at", True, middle)
+
+    captured: dict[str, Finding] = {}
+    params: dict[str, object] = {}
+    current = [""]
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and statement not in captured:
+            captured[statement] = Finding(current[0], statement)
+            params[statement] = parameters
+
+    headers = {"Authorization": f"Bearer {create_token(users[0])}"}
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://advisor") as client:
+        for label, method, path, data in _requests(ctx):
+            current[0] = label
+            if method == "GET":
+                resp = await client.get(path, params=data, headers=headers)
+            else:
+                resp = await client.request(method, path, json=data, headers=headers)
+            if resp.status_code >= 500:
+                print(f"{label}: HTTP {resp.status_code}", file=sys.stderr)
+    event.remove(async_engine.sync_engine, "before_cursor_execute", _capture)
+
+    failed = False
+    async with async_engine.connect() as conn:
+        dialect = conn.dialect.name
+        sizes: dict[str, int] = {}
+        for statement, finding in captured.items():
+            finding.problems, finding.plan = await _explain(
+                conn, dialect, statement, params[statement]
+            )
+            for kind, table in finding.problems:
+                table = table or _main_table(statement)
+                if table and table not in sizes:
+                    sizes[table] = await conn.scalar(text(f"SELECT count(*) FROM {table}"))
+            print(f"\n[{finding.label}] {' '.join(statement.split())[:160]}")
+            if args.verbose:
+                for line in finding.plan:
+                    print(f"    {line}")
+            if not finding.problems:
+                print("  ok: served from indexes")
+                continue
+            tables = []
+            for kind, table in finding.problems:
+                table = table or _main_table(statement)
+                rows = sizes.get(table, 0)
+                blocking = rows >= args.min_rows
+                failed |= blocking
+                print(f"  {'FAIL' if blocking else 'note'}: {kind} on {table} ({rows} rows)")
+                if table not in tables:
+                    tables.append(table)
+            # a scan and the sort that follows it usually want the same index
+            for table in tables:
+                proposal = propose(" ".join(statement.split()), table)
+                if proposal:
+                    print(f"  proposal: {proposal}")
+    await async_engine.dispose()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    p.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL", DEFAULT_DB))
+    p.add_argument("--users", type=int, default=5)
+    p.add_argument("--apps", type=int, default=2000, help="applications per user")
+    p.add_argument("--min-rows", type=int, default=1000, help="smaller tables may be scanned")
+    p.add_argument("-v", "--verbose", action="store_true", help="print every plan")
+    sys.exit(asyncio.run(main(p.parse_args())))
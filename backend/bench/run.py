@@ -0,0 +1,242 @@
+# bench/run.py
+"""Drive the real FastAPI routers in-process and report throughput/latency.
+
+    python -m bench.run --users 5 --apps 500 --requests 300 --concurrency 16
+    python -m bench.run ... --save-baseline bench/baselines/sqlite.json
+    python -m bench.run ... --compare bench/baselines/sqlite.json   # exit 1 on regression
+
+DATABASE_URL defaults to a local SQLite file; point it at a scratch Postgres
+with --database-url. The database is wiped and reseeded on every run.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from dataclasses import asdict, dataclass
+
+DEFAULT_DB = "sqlite:///./bench.sqlite3"
+SEED = 7
+
+
+@dataclass
+class Result:
+    requests: int
+    errors: int
+    rps: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    statements_per_request: float
+    kb_per_response: float  # bytes on the wire, after compression
+
+
+def _scenarios(ctx):
+    """name -> coroutine factory taking (client, rng) and returning a response."""
+
+    def auth(rng):
+        uid = rng.choice(ctx["users"])
+        return uid, {"Authorization": f"Bearer {ctx['tokens'][uid]}"}
+
+    async def list_apps(client, rng):
+        _, h = auth(rng)
+        return await client.get("/applications", params={"page_size": 50}, headers=h)
+
+    async def list_100(client, rng):
+        # full ApplicationOut rows, jd_text included: dominated by serialization
+        _, h = auth(rng)
+        return await client.get("/applications", params={"page_size": 100}, headers=h)
+
+    async def search(client, rng):
+        _, h = auth(rng)
+        q = rng.choice(["python", "kafka", "Acme", "remote", "postgres"])
+        return await client.get("/applications/search", params={"q": q}, headers=h)
+
+    async def detail(client, rng):
+        uid, h = auth(rng)
+        return await client.get(f"/applications/{rng.choice(ctx['apps'][uid])}/full", headers=h)
+
+    async def create(client, rng):
+        _, h = auth(rng)
+        body = {"company": "BenchCo", "role": "Engineer", "jd_text": "python " * 50}
+        return await client.post("/applications", json=body, headers=h)
+
+    async def tag_assign(client, rng):
+        # always a pair that is not linked yet, so every request takes the same
+        # insert path (a repeat would go down the IntegrityError/rollback one)
+        uid, h = auth(rng)
+        app_id, tag_id = ctx["unlinked"][uid].pop()
+        return await client.post(f"/tags/assign/{app_id}/{tag_id}", headers=h)
+
+    async def reminders(client, rng):
+        uid, h = auth(rng)
+        return await client.get(f"/reminders/{rng.choice(ctx['apps'][uid])}", headers=h)
+
+    return {
+        "list": list_apps,
+        "list_100": list_100,
+        "search": search,
+        "detail": detail,
+        "create": create,
+        "tag_assign": tag_assign,
+        "reminders": reminders,
+    }
+
+
+async def _run_scenario(client, fn, total: int, concurrency: int, counter: list[int]) -> Result:
+    latencies: list[float] = []
+    errors = 0
+    downloaded = 0
+    remaining = total
+
+    async def worker():
+        nonlocal remaining, errors, downloaded
+        while remaining > 0:
+            remaining -= 1
+            # seeded per request rather than shared: workers interleave differently
+            # on every run, but request i always makes the same choices
+            rng = random.Random(SEED + total - remaining)
+            start = time.perf_counter()
+            resp = await fn(client, rng)
+            latencies.append(time.perf_counter() - start)
+            downloaded += resp.num_bytes_downloaded
+            if resp.status_code >= 400:
+                errors += 1
+
+    counter[0] = 0
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    q = statistics.quantiles(latencies, n=100, method="inclusive")
+    return Result(
+        requests=len(latencies),
+        errors=errors,
+        rps=round(len(latencies) / elapsed, 1),
+        p50_ms=round(q[49] * 1000, 2),
+        p95_ms=round(q[94] * 1000, 2),
+        p99_ms=round(q[98] * 1000, 2),
+        statements_per_request=round(counter[0] / len(latencies), 2),
+        kb_per_response=round(downloaded / len(latencies) / 1024, 1),
+    )
+
+
+def _compare(results: dict[str, Result], baseline: dict, tolerance: float) -> list[str]:
+    failures = []
+    for name, r in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        if r.p95_ms > base["p95_ms"] * (1 + tolerance):
+            failures.append(f"{name}: p95 {r.p95_ms}ms vs baseline {base['p95_ms']}ms")
+        if r.rps < base["rps"] * (1 - tolerance):
+            failures.append(f"{name}: {r.rps} req/s vs baseline {base['rps']} req/s")
+        # statement counts are deterministic (per-request seeds, seeded data and
+        # no repeated writes): any increase is a regression
+        if r.statements_per_request > base["statements_per_request"]:
+            failures.append(
+                f"{name}: {r.statements_per_request} statements/request "
+                f"vs baseline {base['statements_per_request']}"
+            )
+    return failures
+
+
+async def main(args) -> int:
+    # settings are read at import time, so configure the DB before importing app
+    os.environ["DATABASE_URL"] = args.database_url
+    os.environ.setdefault("JWT_SECRET", "bench-secret")
+    # a handful of users replaying hundreds of requests would just measure 429s
+    os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+    import httpx
+    from sqlalchemy import event, select, tuple_
+
+    from app.db import AsyncSessionLocal, async_engine
+    from app.main import app
+    from app.models import Application, Tag, application_tags
+    from app.security import create_token
+
+    from .seed import seed
+
+    print(f"seeding {args.users} users x {args.apps} applications ...", file=sys.stderr)
+    users = seed(args.users, args.apps)
+    ctx: dict = {
+        "users": users,
+        "tokens": {u: create_token(u) for u in users},
+        "apps": {},
+        "tags": {},
+        "unlinked": {},
+    }
+    async with AsyncSessionLocal() as db:
+        for uid in users:
+            rows = await db.scalars(select(Application.id).where(Application.user_id == uid))
+            ctx["apps"][uid] = rows.all()
+            ctx["tags"][uid] = (await db.scalars(select(Tag.id).where(Tag.user_id == uid))).all()
+            linked = select(application_tags.c.application_id, application_tags.c.tag_id)
+            pairs = (
+                await db.execute(
+                    select(Application.id, Tag.id)
+                    .join(Tag, Tag.user_id == Application.user_id)
+                    .where(
+                        Application.user_id == uid,
+                        tuple_(Application.id, Tag.id).not_in(linked),
+                    )
+                    .order_by(Application.id, Tag.id)
+                )
+            ).all()
+            random.Random(SEED).shuffle(pairs)
+            ctx["unlinked"][uid] = pairs
+
+    counter = [0]
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def _count(*_):
+        counter[0] += 1
+
+    scenarios = _scenarios(ctx)
+    selected = args.scenarios.split(",") if args.scenarios else list(scenarios)
+    results: dict[str, Result] = {}
+    # server errors are counted per scenario instead of aborting the run
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name in selected:
+            await _run_scenario(client, scenarios[name], min(20, args.requests), 4, counter)
+            results[name] = await _run_scenario(
+                client, scenarios[name], args.requests, args.concurrency, counter
+            )
+            r = results[name]
+            print(
+                f"{name:<12} {r.rps:>9} req/s  p50 {r.p50_ms:>8}ms  p95 {r.p95_ms:>8}ms  "
+                f"p99 {r.p99_ms:>8}ms  {r.statements_per_request:>5} stmts/req  "
+                f"{r.kb_per_response:>8} KB/resp  {r.errors} errors"
+            )
+    await async_engine.dispose()
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.save_baseline) or ".", exist_ok=True)
+        with open(args.save_baseline, "w") as f:
+            json.dump({k: asdict(v) for k, v in results.items()}, f, indent=2)
+        print(f"baseline written to {args.save_baseline}", file=sys.stderr)
+    if args.compare:
+        with open(args.compare) as f:
+            failures = _compare(results, json.load(f), args.tolerance)
+        for msg in failures:
+            print(f"REGRESSION {msg}", file=sys.stderr)
+        return 1 if failures else 0
+    return 0
+
+
+if __name__ == "__main__":
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    p.add_argument("--database-url", default=os.getenv("BENCH_DATABASE_URL", DEFAULT_DB))
+    p.add_argument("--users", type=int, default=5)
+    p.add_argument("--apps", type=int, default=500, help="applications per user")
+    p.add_argument("--requests", type=int, default=300, help="requests per scenario")
+    p.add_argument("--concurrency", type=int, default=16)
+    p.add_argument("--scenarios", help="comma-separated subset, e.g. list,search")
+    p.add_argument("--save-baseline", metavar="PATH")
+    p.add_argument("--compare", metavar="PATH")
+    p.add_argument("--tolerance", type=float, default=0.25, help="allowed latency/rps drift")
+    sys.exit(asyncio.run(main(p.parse_args())))
@@ -0,0 +1,118 @@
+# bench/seed.py
+"""Seed a database with synthetic users, applications and child rows.
+
+Uses the sync engine and executemany inserts; only ever run it against a
+throwaway database (it drops and recreates every table).
+"""
+
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert
+
+from app.db import Base, engine
+from app.models import (
+    Application,
+    Contact,
+    Note,
+    Reminder,
+    Stage,
+    StageType,
+    Status,
+    Tag,
+    User,
+    application_tags,
+)
+
+COMPANIES = ["Acme", "Globex", "Initech", "Umbrella", "Hooli", "Stark", "Wayne", "Wonka"]
+ROLES = ["Backend Engineer", "Data Engineer", "SRE", "Frontend Engineer", "ML Engineer"]
+LOCATIONS = ["Remote", "New York", "Berlin", "London", "Toronto", None]
+JD_WORDS = (
+    "python postgres kubernetes react typescript distributed systems latency "
+    "observability terraform aws gcp kafka graphql testing ownership mentoring"
+).split()
+TAGS = ["remote", "referral", "dream", "startup", "bigco", "visa", "urgent", "fintech"]
+
+
+def _jd(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(JD_WORDS) for _ in range(words))
+
+
+def seed(users: int, apps_per_user: int, jd_words: int = 300, seed: int = 42) -> list[str]:
+    """Drop/recreate the schema and fill it. Returns the seeded user ids."""
+    rng = random.Random(seed)
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    now = datetime.now(timezone.utc)
+    user_ids = []
+    with engine.begin() as conn:
+        for u in range(users):
+            uid = str(uuid.uuid4())
+            user_ids.append(uid)
+            conn.execute(
+                insert(User),
+                [{"id": uid, "email": f"bench{u}@example.com", "password_hash": "x"}],
+            )
+            tag_rows = [{"id": str(uuid.uuid4()), "user_id": uid, "name": t} for t in TAGS]
+            conn.execute(insert(Tag), tag_rows)
+            apps, notes, stages, contacts, reminders, links = [], [], [], [], [], []
+            for _ in range(apps_per_user):
+                aid = str(uuid.uuid4())
+                applied = now - timedelta(days=rng.randint(0, 365))
+                apps.append(
+                    {
+                        "id": aid,
+                        "user_id": uid,
+                        "company": rng.choice(COMPANIES),
+                        "role": rng.choice(ROLES),
+                        "location": rng.choice(LOCATIONS),
+                        "status": rng.choice(list(Status)),
+                        "jd_text": _jd(rng, jd_words),
+                        "applied_at": applied,
+                        "last_update_at": applied + timedelta(days=rng.randint(0, 30)),
+                    }
+                )
+                for _ in range(2):
+                    notes.append(
+                        {
+                            "id": str(uuid.uuid4()),
+                            "application_id": aid,
+                            "user_id": uid,
+                            "content": _jd(rng, 20),
+                            "created_at": applied,
+                        }
+                    )
+                stages.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "application_id": aid,
+                        "type": rng.choice(list(StageType)),
+                        "created_at": applied,
+                    }
+                )
+                contacts.append(
+                    {"id": str(uuid.uuid4()), "application_id": aid, "name": "Recruiter"}
+                )
+                reminders.append(
+                    {
+                        "id": str(uuid.uuid4()),
+                        "application_id": aid,
+                        "due_at": applied + timedelta(days=7),
+                        "message": "follow up",
+                        "sent": rng.random() < 0.5,
+                    }
+                )
+                for tag in rng.sample(tag_rows, 2):
+                    links.append({"application_id": aid, "tag_id": tag["id"]})
+            for model, rows in (
+                (Application, apps),
+                (Note, notes),
+                (Stage, stages),
+                (Contact, contacts),
+                (Reminder, reminders),
+                (application_tags, links),
+            ):
+                if rows:
+                    conn.execute(insert(model), rows)
+    return user_ids
@@ -0,0 +1,69 @@
+import os
+import tempfile
+
+# settings are read at import time, so configure them before importing the app
+_tmp = tempfile.mkdtemp(prefix="jobtracker-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp}/test.db"
+os.environ["JWT_SECRET"] = "test-secret"
+os.environ["RATE_LIMIT_ENABLED"] = "false"
+os.environ["REMINDER_DISPATCH_ENABLED"] = "false"
+os.environ["AWS_S3_BUCKET"] = "test-documents"
+os.environ["AWS_REGION"] = "us-east-1"
+os.environ["AWS_ACCESS_KEY_ID"] = "testing"
+os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
+
+import boto3  # noqa: E402
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from moto.server import ThreadedMotoServer  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.db import Base, SessionLocal, engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import User  # noqa: E402
+from app.security import create_token  # noqa: E402
+from app.services import s3  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def s3_endpoint():
+    """A local moto S3 server holding the documents bucket."""
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=0, verbose=False)
+    server.start()
+    host, port = server.get_host_and_port()
+    url = f"http://{host}:{port}"
+    boto3.client("s3", endpoint_url=url).create_bucket(Bucket=settings.AWS_S3_BUCKET)
+    yield url
+    server.stop()
+
+
+@pytest.fixture
+def s3_client(s3_endpoint, monkeypatch):
+    # point the lazily built client at moto and start every test with a cold cache
+    monkeypatch.setattr(settings, "AWS_S3_ENDPOINT_URL", s3_endpoint)
+    monkeypatch.setattr(s3, "_client", None)
+    s3._get_urls.clear()
+    yield s3._s3()
+    s3._get_urls.clear()
+
+
+@pytest.fixture
+def db():
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture
+def users(db):
+    db.add_all(
+        [User(id=uid, email=f"{uid}@example.com", password_hash="x") for uid in ("u1", "u2")]
+    )
+    db.commit()
+    return {uid: {"Authorization": f"Bearer {create_token(uid)}"} for uid in ("u1", "u2")}
@@ -0,0 +1,163 @@
+from datetime import datetime, timedelta
+
+from app.models import Application
+from app.routers.applications import IMPORT_BATCH_SIZE
+
+
+def _create(client, headers, n):
+    for i in range(n):
+        resp = client.post("/applications", json={"company": f"C{i}", "role": "R"}, headers=headers)
+        assert resp.status_code == 200
+
+
+def test_sparse_fields_keyset_pages(client, users):
+    _create(client, users["u1"], 5)
+    params = {"fields": "company", "sort": "company", "page_size": 2, "cursor": ""}
+    seen = []
+    while True:
+        page = client.get("/applications", params=params, headers=users["u1"]).json()
+        assert all(set(item) == {"id", "company"} for item in page["items"])
+        seen += [item["company"] for item in page["items"]]
+        if page["next_cursor"] is None:
+            break
+        params["cursor"] = page["next_cursor"]
+    assert seen == [f"C{i}" for i in range(5)]
+
+
+def test_offset_pages_full_and_summary(client, users):
+    _create(client, users["u1"], 3)
+    full = client.get("/applications", params={"page_size": 2}, headers=users["u1"]).json()
+    assert len(full) == 2 and "jd_text" in full[0]
+    summary = client.get(
+        "/applications",
+        params={"fields": "summary", "page": 2, "page_size": 2},
+        headers=users["u1"],
+    ).json()
+    assert len(summary) == 1 and "jd_text" not in summary[0]
+
+
+def _walk(client, headers, sort, page_size=2):
+    params = {"sort": sort, "page_size": page_size, "cursor": "", "fields": "id"}
+    ids = []
+    while True:
+        page = client.get("/applications", params=params, headers=headers).json()
+        ids += [item["id"] for item in page["items"]]
+        if page["next_cursor"] is None:
+            return ids
+        params["cursor"] = page["next_cursor"]
+
+
+def test_keyset_walk_with_nulls_and_duplicate_keys(client, db, users):
+    day = datetime(2026, 3, 1)
+    applied = [day, None, day, day - timedelta(days=3), None, day + timedelta(days=1), None]
+    locations = ["Berlin", None, "Austin", "Berlin", None, "Zurich", "Austin"]
+    db.add_all(
+        [
+            Application(
+                id=f"app{i}",
+                user_id="u1",
+                company=f"C{i % 3}",
+                role="R",
+                applied_at=applied[i],
+                location=locations[i],
+                last_update_at=applied[i],
+            )
+            for i in range(len(applied))
+        ]
+    )
+    db.add(Application(id="other", user_id="u2", company="C", role="R"))
+    db.commit()
+    rows = [(f"app{i}", applied[i], locations[i], f"C{i % 3}") for i in range(len(applied))]
+
+    def expected(key, descending):
+        present = sorted((r for r in rows if key(r) is not None), key=lambda r: (key(r), r[0]))
+        missing = sorted((r for r in rows if key(r) is None), key=lambda r: r[0])
+        if descending:
+            present.reverse()
+            missing.reverse()
+        return [r[0] for r in present + missing]  # NULLs last both ways
+
+    for field, key in (
+        ("applied_at", lambda r: r[1]),
+        ("last_update_at", lambda r: r[1]),
+        ("location", lambda r: r[2]),
+        ("company", lambda r: r[3]),
+    ):
+        for descending in (False, True):
+            sort = f"-{field}" if descending else field
+            want = expected(key, descending)
+            for page_size in (1, 2, 3, 10):
+                assert _walk(client, users["u1"], sort, page_size) == want, (sort, page_size)
+            # offset paging returns the same order
+            listed = client.get(
+                "/applications",
+                params={"sort": sort, "page_size": 100, "fields": "id"},
+                headers=users["u1"],
+            ).json()
+            assert [a["id"] for a in listed] == want, sort
+
+
+def _kinds(client, headers, app_id):
+    resp = client.get(f"/applications/{app_id}/timeline", headers=headers)
+    assert resp.status_code == 200
+    return [(e["kind"], e["from_status"], e["to_status"]) for e in resp.json()]
+
+
+def test_batch_status_and_delete_update_stats_and_timeline(client, users):
+    h = users["u1"]
+    a, b, c = (
+        client.post("/applications", json={"company": f"C{i}", "role": "R"}, headers=h).json()["id"]
+        for i in range(3)
+    )
+    for app_id in (a, b):
+        stage = {"application_id": app_id, "type": "ONSITE"}
+        assert client.post("/stages", json=stage, headers=h).status_code == 200
+    resp = client.post(
+        "/applications/batch",
+        json={
+            "operations": [
+                {"op": "set_status", "ids": [a, c], "status": "INTERVIEW"},
+                {"op": "delete", "ids": [b, "missing"]},
+            ]
+        },
+        headers=h,
+    )
+    assert resp.status_code == 200
+    assert [(r["id"], r["ok"]) for r in resp.json()["results"]] == [
+        (a, True),
+        (c, True),
+        (b, True),
+        ("missing", False),
+    ]
+
+    stats = client.get("/stats", headers=h).json()
+    assert stats["total"] == 2
+    assert stats["by_status"].get("INTERVIEW") == 2
+    assert stats["by_status"].get("APPLIED", 0) == 0
+    assert stats["stages_reached"].get("ONSITE") == 1
+
+    assert _kinds(client, h, a)[-1] == ("status_changed", "APPLIED", "INTERVIEW")
+    assert _kinds(client, h, b)[-1] == ("deleted", "APPLIED", None)
+    assert client.get(f"/applications/{b}", headers=h).status_code == 404
+
+
+def test_import_spans_several_batches(client, users):
+    h = users["u1"]
+    rows = 2 * IMPORT_BATCH_SIZE + 5
+    lines = ["company,role,status"] + [f"C{i},R,OA" for i in range(rows)] + [",R,OA"]
+    resp = client.post(
+        "/applications/import",
+        content="\n".join(lines).encode(),
+        headers={**h, "content-type": "text/csv"},
+    )
+    assert resp.status_code == 200
+    result = resp.json()
+    assert result["inserted"] == rows
+    assert result["failed"] == 1 and result["errors"][0]["line"] == rows + 2
+
+    stats = client.get("/stats", headers=h).json()
+    assert stats["total"] == rows and stats["by_status"]["OA"] == rows
+    page = client.get(
+        "/applications", params={"fields": "id", "page_size": 1, "cursor": ""}, headers=h
+    ).json()
+    assert _kinds(client, h, page["items"][0]["id"]) == [("created", None, "OA")]
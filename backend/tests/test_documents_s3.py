@@ -0,0 +1,157 @@
+import httpx
+import pytest
+
+from app import cache
+from app.config import settings
+from app.models import Application, Document
+from app.services import s3
+
+
+class _Clock:
+    """Stands in for the time module inside app.cache so TTLs can be stepped."""
+
+    now = 1000.0
+
+    @classmethod
+    def monotonic(cls):
+        return cls.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    _Clock.now = 1000.0
+    monkeypatch.setattr(cache, "time", _Clock)
+    return _Clock
+
+
+@pytest.fixture
+def signed(s3_client, monkeypatch):
+    """Counts the URLs actually signed by the S3 client."""
+    calls = []
+    generate = s3_client.generate_presigned_url
+
+    def spy(*args, **kwargs):
+        calls.append(kwargs["Params"]["Key"])
+        return generate(*args, **kwargs)
+
+    monkeypatch.setattr(s3_client, "generate_presigned_url", spy)
+    return calls
+
+
+@pytest.fixture
+def documents(db, users, s3_client):
+    """Two uploaded documents of u1 and one of u2."""
+    db.add_all(
+        [
+            Application(id="a1", user_id="u1", company="Acme", role="Engineer"),
+            Application(id="a2", user_id="u2", company="Globex", role="Engineer"),
+        ]
+    )
+    for doc_id, app_id in (("d1", "a1"), ("d2", "a1"), ("d3", "a2")):
+        key = f"uploads/{doc_id}.pdf"
+        s3_client.put_object(Bucket=settings.AWS_S3_BUCKET, Key=key, Body=doc_id.encode())
+        # key and its s3_key alias share one column; the alias wins on flush
+        db.add(Document(id=doc_id, application_id=app_id, s3_key=key, filename=f"{doc_id}.pdf"))
+    db.commit()
+
+
+# ---------- presign cache ----------
+
+
+def test_presign_get_reuses_url_until_margin_before_expiry(signed, clock, monkeypatch):
+    monkeypatch.setattr(settings, "PRESIGN_CACHE_MARGIN_SECONDS", 300)
+
+    url = s3.presign_get("uploads/cv.pdf", expires_in=900)
+    assert s3.presign_get("uploads/cv.pdf", expires_in=900) == url
+    clock.now += 599
+    assert s3.presign_get("uploads/cv.pdf", expires_in=900) == url
+    assert signed == ["uploads/cv.pdf"]
+
+    # 300s before the URL itself expires the cache lets go and signs afresh
+    clock.now += 2
+    s3.presign_get("uploads/cv.pdf", expires_in=900)
+    assert signed == ["uploads/cv.pdf", "uploads/cv.pdf"]
+
+
+def test_presign_get_does_not_cache_urls_shorter_than_margin(signed, monkeypatch):
+    monkeypatch.setattr(settings, "PRESIGN_CACHE_MARGIN_SECONDS", 300)
+
+    s3.presign_get("uploads/cv.pdf", expires_in=300)
+    s3.presign_get("uploads/cv.pdf", expires_in=300)
+    assert len(signed) == 2
+
+
+def test_presign_get_caches_per_expiry(signed):
+    s3.presign_get("uploads/cv.pdf", expires_in=900)
+    s3.presign_get("uploads/cv.pdf", expires_in=3600)
+    assert len(signed) == 2
+
+
+# ---------- batch endpoints ----------
+
+
+def test_presign_batch_uploads_to_s3(client, users, documents, s3_client):
+    files = [
+        {"file_name": f"cv{i}.pdf", "content_type": "application/pdf", "file_type": "resume"}
+        for i in range(3)
+    ]
+    resp = client.post("/documents/a1/presign-batch", json={"files": files}, headers=users["u1"])
+    assert resp.status_code == 200
+    uploads = resp.json()["uploads"]
+    assert [u["s3_key"] for u in uploads] == [f"uploads/cv{i}.pdf" for i in range(3)]
+
+    for upload in uploads:
+        put = httpx.put(
+            upload["upload_url"], content=b"%PDF", headers={"Content-Type": "application/pdf"}
+        )
+        assert put.status_code == 200
+    stored = s3_client.get_object(Bucket=settings.AWS_S3_BUCKET, Key="uploads/cv0.pdf")
+    assert stored["Body"].read() == b"%PDF"
+
+
+def test_presign_batch_rejects_foreign_application(client, users, documents, signed):
+    files = [{"file_name": "cv.pdf", "content_type": "application/pdf", "file_type": "resume"}]
+    resp = client.post("/documents/a2/presign-batch", json={"files": files}, headers=users["u1"])
+    assert resp.status_code == 404
+    assert signed == []
+
+
+def test_presign_batch_enforces_max(client, users, documents, monkeypatch):
+    monkeypatch.setattr(settings, "PRESIGN_BATCH_MAX", 2)
+    files = [{"file_name": "cv.pdf", "content_type": "application/pdf", "file_type": "resume"}] * 3
+    resp = client.post("/documents/a1/presign-batch", json={"files": files}, headers=users["u1"])
+    assert resp.status_code == 400
+
+
+def test_download_batch_signs_owned_documents(client, users, documents):
+    resp = client.post(
+        "/documents/download-batch", json={"document_ids": ["d1", "d2"]}, headers=users["u1"]
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    assert [u["id"] for u in body["urls"]] == ["d1", "d2"]
+    assert body["missing"] == []
+    assert [httpx.get(u["url"]).content for u in body["urls"]] == [b"d1", b"d2"]
+
+
+def test_download_batch_reports_foreign_and_unknown_ids_per_item(client, users, documents, signed):
+    resp = client.post(
+        "/documents/download-batch",
+        json={"document_ids": ["d1", "d3", "nope", "d2"]},
+        headers=users["u1"],
+    )
+    assert resp.status_code == 200
+    body = resp.json()
+    # u2's d3 is indistinguishable from an id that does not exist, and never signed
+    assert [u["id"] for u in body["urls"]] == ["d1", "d2"]
+    assert body["missing"] == ["d3", "nope"]
+    assert "uploads/d3.pdf" not in signed
+
+
+def test_download_batch_with_only_foreign_ids(client, users, documents, signed):
+    resp = client.post(
+        "/documents/download-batch", json={"document_ids": ["d1", "d2"]}, headers=users["u2"]
+    )
+    assert resp.status_code == 200
+    assert resp.json() == {"urls": [], "missing": ["d1", "d2"]}
+    assert signed == []
@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.db import AsyncSessionLocal, async_engine
+from app.instrumentation import RequestSQLStats, _current
+
+
+def test_failed_statement_does_not_skew_later_timings(db):
+    stats = RequestSQLStats()
+
+    async def run():
+        token = _current.set(stats)
+        try:
+            async with AsyncSessionLocal() as session:
+                with pytest.raises(OperationalError):
+                    await session.execute(text("SELECT * FROM no_such_table"))
+                await session.rollback()
+                await session.execute(text("SELECT 1"))
+                conn = await session.connection()
+                return dict(conn.info)
+        finally:
+            _current.reset(token)
+            await async_engine.dispose()
+
+    info = asyncio.run(run())
+
+    # only the statement that completed is counted, and nothing is left on the connection
+    assert stats.statements == 1
+    assert list(stats.by_statement) == ["SELECT 1"]
+    assert "query_start" not in info
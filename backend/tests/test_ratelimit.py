@@ -0,0 +1,39 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.ratelimit import RateLimitMiddleware
+
+
+def _client(monkeypatch, limits):
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+    monkeypatch.setattr(settings, "RATE_LIMITS", limits)
+    monkeypatch.setattr(settings, "RATE_LIMIT_STORE_URL", "")
+    api = FastAPI()
+
+    @api.get("/applications/search")
+    @api.get("/applications")
+    @api.get("/health")
+    def ok():
+        return {"ok": True}
+
+    # rules are read when the middleware is built, so build it after patching
+    return TestClient(RateLimitMiddleware(api))
+
+
+def test_throttled_requests_get_429_with_retry_after(monkeypatch, users):
+    client = _client(monkeypatch, {"GET /applications/search": "2/minute"})
+    h = users["u1"]
+    for _ in range(2):
+        assert client.get("/applications/search", headers=h).status_code == 200
+
+    resp = client.get("/applications/search", headers=h)
+    assert resp.status_code == 429
+    assert resp.json() == {"detail": "Rate limit exceeded"}
+    # one token refills every 30s at 2/minute
+    assert 0 < int(resp.headers["retry-after"]) <= 30
+
+    # other rules, other users and exempt paths keep their own budgets
+    assert client.get("/applications", headers=h).status_code == 200
+    assert client.get("/applications/search", headers=users["u2"]).status_code == 200
+    assert client.get("/health").status_code == 200
@@ -0,0 +1,94 @@
+import asyncio
+from datetime import datetime, timedelta
+
+from app.db import AsyncSessionLocal, SessionLocal, async_engine
+from app.models import Application, ApplicationEvent, Reminder
+from app.services.reminders import dispatch_due
+
+
+class _Notifier:
+    """Records deliveries, fails for recipients in `failing`, and snapshots the
+    claimed row from a separate connection while "sending"."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.sent = []
+        self.seen_during_send = []
+
+    def send(self, to, subject, body):
+        with SessionLocal() as other:
+            self.seen_during_send.append(
+                other.query(Reminder.next_attempt_at).filter(Reminder.message == body).scalar()
+            )
+        if to in self.failing:
+            raise OSError("mailbox unavailable")
+        self.sent.append((to, subject, body))
+
+
+def _dispatch(notifier, **kwargs):
+    async def run():
+        try:
+            async with AsyncSessionLocal() as db:
+                return await dispatch_due(db, notifier, **kwargs)
+        finally:
+            # pooled aiosqlite connections are tied to this loop
+            await async_engine.dispose()
+
+    return asyncio.run(run())
+
+
+def _seed(db, now):
+    db.add_all(
+        [
+            Application(id="a1", user_id="u1", company="Acme", role="Engineer"),
+            Application(id="a2", user_id="u2", company="Globex", role="SRE"),
+            Reminder(id="due", application_id="a1", due_at=now - timedelta(hours=1), message="m1"),
+            Reminder(id="later", application_id="a1", due_at=now + timedelta(days=1), message="m2"),
+            Reminder(
+                id="done",
+                application_id="a1",
+                due_at=now - timedelta(days=1),
+                message="m3",
+                sent=True,
+            ),
+            Reminder(
+                id="fails", application_id="a2", due_at=now - timedelta(hours=2), message="m4"
+            ),
+        ]
+    )
+    db.commit()
+
+
+def test_dispatch_sends_due_reminders_and_backs_off_failures(db, users):
+    now = datetime.utcnow()
+    _seed(db, now)
+    notifier = _Notifier(failing={"u2@example.com"})
+
+    assert _dispatch(notifier) == 1
+    assert notifier.sent == [("u1@example.com", "Reminder: Acme — Engineer", "m1")]
+    # the claim (a lease in next_attempt_at) was committed before delivery started
+    assert all(lease is not None and lease > now for lease in notifier.seen_during_send)
+
+    db.expire_all()
+    due, later, done, fails = (db.get(Reminder, i) for i in ("due", "later", "done", "fails"))
+    assert (due.sent, due.attempts, due.next_attempt_at, due.last_error) == (True, 1, None, None)
+    assert (later.sent, later.attempts) == (False, 0)
+    assert done.attempts == 0
+    assert (fails.sent, fails.attempts, fails.last_error) == (False, 1, "mailbox unavailable")
+    assert fails.next_attempt_at.tzinfo is None
+    assert fails.next_attempt_at > now + timedelta(seconds=30)
+    kinds = {(e.application_id, e.kind) for e in db.query(ApplicationEvent)}
+    assert kinds == {("a1", "reminder_sent"), ("a2", "reminder_failed")}
+
+    # nothing is due again until the failed one's backoff has passed
+    assert _dispatch(_Notifier()) == 0
+
+
+def test_dispatch_for_one_user(db, users):
+    _seed(db, datetime.utcnow())
+    notifier = _Notifier()
+
+    assert _dispatch(notifier, user_id="u2") == 1
+    assert [to for to, _, _ in notifier.sent] == ["u2@example.com"]
+    db.expire_all()
+    assert db.get(Reminder, "due").sent is False
@@ -0,0 +1,21 @@
+def test_search_and_q_filter(client, users):
+    h = users["u1"]
+    for company, jd in (("Acme", "python and postgres"), ("Globex", "java"), ("Initech", None)):
+        body = {"company": company, "role": "Engineer", "jd_text": jd}
+        assert client.post("/applications", json=body, headers=h).status_code == 200
+    client.post(
+        "/applications", json={"company": "Other", "role": "Python dev"}, headers=users["u2"]
+    )
+
+    hits = client.get("/applications/search", params={"q": "pyth"}, headers=h).json()
+    assert [hit["company"] for hit in hits] == ["Acme"]
+    assert "<mark>" in (hits[0]["snippet"] or "")
+
+    listed = client.get("/applications", params={"q": "java"}, headers=h).json()
+    assert [a["company"] for a in listed] == ["Globex"]
+
+    # edits are picked up by the index
+    app_id = listed[0]["id"]
+    body = {"company": "Globex", "role": "Engineer", "jd_text": "kotlin"}
+    assert client.patch(f"/applications/{app_id}", json=body, headers=h).status_code == 200
+    assert client.get("/applications", params={"q": "java"}, headers=h).json() == []
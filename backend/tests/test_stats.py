@@ -0,0 +1,12 @@
+def test_refresh_invalidates_stats_etag(client, users):
+    first = client.get("/stats", headers=users["u1"])
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert client.get("/stats", headers={**users["u1"], "If-None-Match": etag}).status_code == 304
+
+    resp = client.post("/stats/refresh", headers=users["u1"])
+    assert resp.status_code == 200
+
+    again = client.get("/stats", headers={**users["u1"], "If-None-Match": etag})
+    assert again.status_code == 200
+    assert again.headers["etag"] != etag
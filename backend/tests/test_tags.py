@@ -0,0 +1,17 @@
+def test_tag_list_revalidates_after_own_writes(client, users):
+    h = users["u1"]
+    app_id = client.post("/applications", json={"company": "C", "role": "R"}, headers=h).json()[
+        "id"
+    ]
+    tag = client.post("/tags", json={"name": "remote"}, headers=h).json()
+
+    first = client.get("/tags", headers=h)
+    assert first.headers["cache-control"] == "private, no-cache"
+    assert first.json() == [{"id": tag["id"], "name": "remote", "count": 0}]
+    etag = first.headers["etag"]
+    assert client.get("/tags", headers={**h, "If-None-Match": etag}).status_code == 304
+
+    client.post(f"/tags/assign/{app_id}/{tag['id']}", headers=h)
+    again = client.get("/tags", headers={**h, "If-None-Match": etag})
+    assert again.status_code == 200
+    assert again.json()[0]["count"] == 1
@@ -0,0 +1,27 @@
+def test_view_with_tag_filter(client, users):
+    h = users["u1"]
+    apps = [
+        client.post("/applications", json={"company": f"C{i}", "role": "R"}, headers=h).json()["id"]
+        for i in range(3)
+    ]
+    remote = client.post("/tags", json={"name": "remote"}, headers=h).json()["id"]
+    dream = client.post("/tags", json={"name": "dream"}, headers=h).json()["id"]
+    for app_id, tag_id in ((apps[0], remote), (apps[1], remote), (apps[1], dream)):
+        client.post(f"/tags/assign/{app_id}/{tag_id}", headers=h)
+
+    body = {"name": "remote dream", "tag_ids": [remote, dream], "tag_mode": "all"}
+    view = client.post("/views", json=body, headers=h).json()
+    assert view["tag_ids"] == [remote, dream] and view["tag_mode"] == "all"
+    found = client.get(f"/views/{view['id']}/applications", headers=h).json()
+    assert [a["id"] for a in found] == [apps[1]]
+
+    body = {"name": "remote dream", "tag_ids": [remote, dream], "tag_mode": "any"}
+    client.patch(f"/views/{view['id']}", json=body, headers=h)
+    found = client.get(f"/views/{view['id']}/applications", headers=h).json()
+    assert sorted(a["id"] for a in found) == sorted(apps[:2])
+
+
+def test_view_rejects_foreign_tags(client, users):
+    theirs = client.post("/tags", json={"name": "remote"}, headers=users["u2"]).json()["id"]
+    resp = client.post("/views", json={"name": "v", "tag_ids": [theirs]}, headers=users["u1"])
+    assert resp.status_code == 400
@@ -7,6 +7,7 @@ import {
   type Application,
   type Status,
 } from "../services/applications";
+import { subscribeChanges } from "../services/realtime";
 
 const STATUSES: Status[] = [
   "APPLIED",
@@ -24,6 +25,16 @@ export default function ApplicationsList() {
 
   const [query, setQuery] = useState("");
   const [filter, setFilter] = useState<"" | Status>("");
+  const [reloadKey, setReloadKey] = useState(0);
+
+  // refetch when another tab (or the reminder runner) changes an application
+  useEffect(
+    () =>
+      subscribeChanges((e) => {
+        if (e.resource === "application") setReloadKey((k) => k + 1);
+      }),
+    []
+  );
 
   useEffect(() => {
     let alive = true;
@@ -42,7 +53,7 @@ export default function ApplicationsList() {
       }
     })();
     return () => { alive = false; };
-  }, []);
+  }, [reloadKey]);
 
   const filtered = useMemo(() => {
     const q = query.trim().toLowerCase();
@@ -18,8 +18,9 @@ export type Application = {
   jd_text?: string | null;
 };
 
+// list views only need the summary projection (no jd_text / salary)
 export async function fetchApplications(): Promise<Application[]> {
-  const { data } = await api.get("/applications");
+  const { data } = await api.get("/applications", { params: { fields: "summary" } });
   return data;
 }
 
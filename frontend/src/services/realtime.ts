@@ -0,0 +1,31 @@
+// src/services/realtime.ts
+import { io, type Socket } from "socket.io-client";
+import { api } from "../api";
+
+export type ChangeEvent = {
+  resource: "application" | "note" | "stage" | "reminder" | "view";
+  action: "created" | "updated" | "deleted";
+  ids: string[];
+  application_id?: string;
+};
+
+let socket: Socket | null = null;
+const handlers = new Set<(e: ChangeEvent) => void>();
+
+// one shared connection for the whole tab, opened on first subscriber
+export function subscribeChanges(handler: (e: ChangeEvent) => void): () => void {
+  if (!socket) {
+    socket = io(api.defaults.baseURL, {
+      auth: (cb) => cb({ token: localStorage.getItem("token") }),
+    });
+    socket.on("change", (e: ChangeEvent) => handlers.forEach((h) => h(e)));
+  }
+  handlers.add(handler);
+  return () => {
+    handlers.delete(handler);
+    if (!handlers.size) {
+      socket?.disconnect();
+      socket = null;
+    }
+  };
+}